@@ -26,10 +26,10 @@ class AttackResult:
 
     weapon_name: str
     attacks_made: int
-    hit_rolls: NDArray[np.int_]
+    hit_rolls: NDArray[np.uint8]
     hits: int
     hits_after_modifiers: int  # After Blast, etc.
-    defense_rolls: NDArray[np.int_]
+    defense_rolls: NDArray[np.uint8]
     wounds_dealt: int
     special_effects: dict[str, int] = field(default_factory=dict)  # e.g., {"rending_hits": 2}
     has_bane: bool = False  # Whether this weapon has Bane (bypasses regeneration)
@@ -231,7 +231,7 @@ class CombatResolver:
                 hit_rolls=hit_rolls,
                 hits=hits,
                 hits_after_modifiers=hits_after_mods,
-                defense_rolls=np.array([], dtype=np.int_),
+                defense_rolls=np.array([], dtype=np.uint8),
                 wounds_dealt=0,
                 special_effects=special_effects,
             )
@@ -323,7 +323,7 @@ class CombatResolver:
     def _apply_hit_modifiers(
         self,
         hits: int,
-        hit_rolls: NDArray[np.int_],
+        hit_rolls: NDArray[np.uint8],
         weapon: Weapon,
         model: Model,
         unit: Unit,
@@ -362,7 +362,7 @@ class CombatResolver:
     def _apply_wound_modifiers(
         self,
         wounds: int,
-        hit_rolls: NDArray[np.int_],
+        hit_rolls: NDArray[np.uint8],
         weapon: Weapon,
         model: Model,
         attacker_unit: Unit,
@@ -1,72 +1,293 @@
 """Combat event data structures for visualization and logging."""
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any
+from array import array
+from dataclasses import MISSING, dataclass, field, fields
+from enum import IntEnum
+from functools import lru_cache
 
 import numpy as np
 from numpy.typing import NDArray
 
+from src.engine.event_queries import filter_by_value, filter_by_values
 
-class CombatEventType(str, Enum):
-    """Types of combat events for visualization."""
+
+class CombatEventType(IntEnum):
+    """Types of combat events for visualization.
+
+    Integer codes so event types can be stored in packed columns and compared
+    as ints; ``label`` gives the lowercase string name used in output.
+    """
 
     # Battle level events
-    BATTLE_START = "battle_start"
-    BATTLE_END = "battle_end"
-    ROUND_START = "round_start"
-    ROUND_END = "round_end"
+    BATTLE_START = 0
+    BATTLE_END = 1
+    ROUND_START = 2
+    ROUND_END = 3
 
     # Activation events
-    ACTIVATION_START = "activation_start"
-    ACTIVATION_END = "activation_end"
-    UNIT_RALLIES = "unit_rallies"
+    ACTIVATION_START = 4
+    ACTIVATION_END = 5
+    UNIT_RALLIES = 6
 
     # Attack sequence events
-    ATTACK_START = "attack_start"
-    WEAPON_ATTACK_START = "weapon_attack_start"
-    HIT_ROLL = "hit_roll"
-    HIT_MODIFIER_APPLIED = "hit_modifier_applied"
-    DEFENSE_ROLL = "defense_roll"
-    WOUND_MODIFIER_APPLIED = "wound_modifier_applied"
-    WEAPON_ATTACK_END = "weapon_attack_end"
-    ATTACK_END = "attack_end"
+    ATTACK_START = 7
+    WEAPON_ATTACK_START = 8
+    HIT_ROLL = 9
+    HIT_MODIFIER_APPLIED = 10
+    DEFENSE_ROLL = 11
+    WOUND_MODIFIER_APPLIED = 12
+    WEAPON_ATTACK_END = 13
+    ATTACK_END = 14
 
     # Wound allocation events
-    WOUND_ALLOCATED = "wound_allocated"
-    MODEL_KILLED = "model_killed"
-    REGENERATION_ROLL = "regeneration_roll"
-    PROTECTED_ROLL = "protected_roll"
+    WOUND_ALLOCATED = 15
+    MODEL_KILLED = 16
+    REGENERATION_ROLL = 17
+    PROTECTED_ROLL = 18
 
     # Special rule events
-    RULE_TRIGGERED = "rule_triggered"
+    RULE_TRIGGERED = 19
 
     # Status events
-    UNIT_SHAKEN = "unit_shaken"
-    UNIT_ROUTED = "unit_routed"
-    UNIT_FATIGUED = "unit_fatigued"
-    MORALE_TEST = "morale_test"
+    UNIT_SHAKEN = 20
+    UNIT_ROUTED = 21
+    UNIT_FATIGUED = 22
+    MORALE_TEST = 23
 
     # Strike back events
-    STRIKE_BACK_START = "strike_back_start"
-    STRIKE_BACK_END = "strike_back_end"
+    STRIKE_BACK_START = 24
+    STRIKE_BACK_END = 25
+
+    @property
+    def label(self) -> str:
+        """Get the string name of the event type (e.g. "hit_roll")."""
+        return _EVENT_TYPE_NAMES[self]
+
+
+# String names indexed by event type code
+_EVENT_TYPE_NAMES: tuple[str, ...] = tuple(event_type.name.lower() for event_type in CombatEventType)
+
+# Event types that carry dice rolls
+_ROLL_TYPES = frozenset({
+    CombatEventType.HIT_ROLL,
+    CombatEventType.DEFENSE_ROLL,
+    CombatEventType.REGENERATION_ROLL,
+    CombatEventType.PROTECTED_ROLL,
+    CombatEventType.MORALE_TEST,
+})
+_ROLL_CODES = np.array(sorted(_ROLL_TYPES), dtype=np.int8)
+
+
+def _int_column(values: array, dtype: type) -> NDArray:
+    """View an array.array column as a NumPy array without copying.
+
+    The view must not outlive the query: an array.array cannot grow while
+    its buffer is exported.
+    """
+    if not values:
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(values, dtype=dtype)
+
+
+# Defense target after AP, clamped to 2+..6+, for the usual defense/AP ranges;
+# anything outside them falls back to computing the clamp
+_EFFECTIVE_TARGET: dict[tuple[int, int], int] = {
+    (target, ap): max(2, min(6, target + ap))
+    for target in range(2, 7)
+    for ap in range(0, 6)
+}
+
+
+# Descriptions of events that only depend on a unit name or round number.
+# Units shake, rally and finish activations many times per battle, so the
+# same handful of strings is built over and over; cache them instead.
+@lru_cache(maxsize=512)
+def _desc_round_start(round_number: int) -> str:
+    return f"Round {round_number} begins"
+
+
+@lru_cache(maxsize=512)
+def _desc_activation_end(unit_name: str) -> str:
+    return f"{unit_name} finishes activation"
+
+
+@lru_cache(maxsize=512)
+def _desc_rally(unit_name: str) -> str:
+    return f"{unit_name} rallies and removes Shaken status"
+
+
+@lru_cache(maxsize=512)
+def _desc_shaken(unit_name: str) -> str:
+    return f"{unit_name} becomes Shaken! (-1 to Quality and Defense)"
+
+
+@lru_cache(maxsize=512)
+def _desc_routed(unit_name: str) -> str:
+    return f"{unit_name} is Routed and flees the battle!"
+
+
+@lru_cache(maxsize=512)
+def _desc_fatigued(unit_name: str) -> str:
+    return f"{unit_name} becomes Fatigued (only hits on unmodified 6s in melee)"
+
+
+@dataclass(slots=True)
+class EventPayload:
+    """Base class for the typed, event-specific data attached to a CombatEvent."""
+
+
+@dataclass(slots=True)
+class BattleStartPayload(EventPayload):
+    """Battle start context."""
+
+    attacker_models: int
+    defender_models: int
+    attacker_total_wounds: int
+    defender_total_wounds: int
+
+
+@dataclass(slots=True)
+class BattleEndPayload(EventPayload):
+    """Battle end outcome."""
+
+    winner: str
+    victory_condition: str
+    attacker_models: int
+    defender_models: int
+
+
+@dataclass(slots=True)
+class RoundEndPayload(EventPayload):
+    """Wounds dealt by each side during a round."""
+
+    attacker_wounds: int
+    defender_wounds: int
+
+
+@dataclass(slots=True)
+class ActivationStartPayload(EventPayload):
+    """Activation action and fatigue."""
+
+    action: str
+    is_fatigued: bool
+
+
+@dataclass(slots=True)
+class AttackStartPayload(EventPayload):
+    """Attack phase and charge flag."""
+
+    phase: str
+    is_charging: bool
+
+
+@dataclass(slots=True)
+class AttackEndPayload(EventPayload):
+    """Attack totals."""
 
+    total_wounds: int
+    models_killed: int
 
-@dataclass
+
+@dataclass(slots=True)
+class WeaponAttackStartPayload(EventPayload):
+    """Weapon attack context."""
+
+    weapon_name: str
+    attacks: int
+    model_name: str
+
+
+@dataclass(slots=True)
+class WeaponAttackEndPayload(EventPayload):
+    """Weapon attack result."""
+
+    weapon_name: str
+    wounds_dealt: int
+
+
+@dataclass(slots=True)
+class FatiguePayload(EventPayload):
+    """Whether the acting unit is fatigued (hit rolls, strike backs)."""
+
+    is_fatigued: bool
+
+
+@dataclass(slots=True)
+class HitModifierPayload(EventPayload):
+    """Hits before and after a modifier."""
+
+    original_hits: int
+    modified_hits: int
+
+
+@dataclass(slots=True)
+class DefenseRollPayload(EventPayload):
+    """Defense roll modifiers."""
+
+    ap: int
+    base_target: int
+    rerolled_sixes: bool
+
+
+@dataclass(slots=True)
+class WoundModifierPayload(EventPayload):
+    """Wounds before and after a modifier."""
+
+    original_wounds: int
+    modified_wounds: int
+
+
+@dataclass(slots=True)
+class WoundAllocatedPayload(EventPayload):
+    """Wounds applied to a model."""
+
+    wounds_applied: int
+    tough: int
+    remaining: int
+
+
+@dataclass(slots=True)
+class ModelKilledPayload(EventPayload):
+    """Overkill wounds on a killed model."""
+
+    overkill: int
+
+
+@dataclass(slots=True)
+class MoraleTestPayload(EventPayload):
+    """Morale test reason and result."""
+
+    reason: str
+    result: str
+
+
+@dataclass(slots=True)
+class StrikeBackEndPayload(EventPayload):
+    """Strike back totals."""
+
+    wounds_dealt: int
+    models_killed: int
+
+
+@dataclass(slots=True)
 class CombatEvent:
     """A single event during combat for visualization."""
 
     event_type: CombatEventType
     timestamp: int  # Sequential event number
-    description: str  # Human-readable description
+
+    # Human-readable description, formatted lazily from the template on first
+    # access to ``description`` (``{dice}`` expands to the dice values)
+    description_template: str
+    description_args: tuple = ()
 
     # Context information
     round_number: int = 0
     active_unit: str = ""
     target_unit: str = ""
 
-    # Dice roll data (if applicable)
-    dice_values: list[int] = field(default_factory=list)
+    # Dice roll data (if applicable); one byte per die, see dice_list
+    dice_values: bytes = b""
     dice_target: int = 0  # Target number to meet
     dice_successes: int = 0
     dice_failures: int = 0
@@ -81,14 +302,106 @@ class CombatEvent:
     wounds_before: int = 0
     wounds_after: int = 0
 
-    # Additional data for complex events
-    extra_data: dict[str, Any] = field(default_factory=dict)
+    # Typed data specific to the event type
+    payload: EventPayload | None = None
+
+    _description: str | None = field(default=None, init=False, repr=False)
+
+    @property
+    def description(self) -> str:
+        """Get the human-readable description, formatting it on first use."""
+        if self._description is None:
+            self._description = self.description_template.format(
+                *self.description_args, dice=self.dice_list
+            )
+        return self._description
+
+    @property
+    def is_dice_roll(self) -> bool:
+        """Check if this event carries a dice roll."""
+        return self.event_type in _ROLL_TYPES
+
+    @property
+    def dice_list(self) -> list[int]:
+        """Get the dice values as a plain list of ints."""
+        return list(self.dice_values)
 
     def __str__(self) -> str:
-        return f"[{self.timestamp}] {self.event_type.value}: {self.description}"
+        return f"[{self.timestamp}] {self.event_type.label}: {self.description}"
 
+    def to_dict(self) -> dict:
+        """Convert to a plain dict for serialization, omitting default fields.
 
-@dataclass
+        Cheaper than dataclasses.asdict: the payload becomes a shallow dict
+        of its fields instead of being deep-copied field by field.
+        """
+        data = {
+            "timestamp": self.timestamp,
+            "event_type": int(self.event_type),
+            "description": self.description,
+        }
+        for name, default in _EVENT_DICT_FIELDS:
+            value = getattr(self, name)
+            if value != default:
+                data[name] = value
+        if self.dice_values:
+            data["dice_values"] = self.dice_list
+        payload = self.payload
+        if payload is not None:
+            data["payload"] = {
+                name: getattr(payload, name) for name in _payload_field_names(type(payload))
+            }
+        return data
+
+    def _reinit(
+        self,
+        event_type: CombatEventType,
+        timestamp: int,
+        description_template: str,
+        description_args: tuple,
+        round_number: int,
+        active_unit: str,
+        target_unit: str,
+    ) -> None:
+        """Overwrite every field in place so a pooled event can be reused."""
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.description_template = description_template
+        self.description_args = description_args
+        self._description = None
+        self.round_number = round_number
+        self.active_unit = active_unit
+        self.target_unit = target_unit
+        self.dice_values = b""
+        self.dice_target = 0
+        self.dice_successes = 0
+        self.dice_failures = 0
+        self.rule_name = ""
+        self.rule_value = None
+        self.rule_effect = ""
+        self.model_name = ""
+        self.wounds_before = 0
+        self.wounds_after = 0
+        self.payload = None
+
+
+@lru_cache(maxsize=None)
+def _payload_field_names(payload_type: type[EventPayload]) -> tuple[str, ...]:
+    """Get the field names CombatEvent.to_dict() emits for a payload class."""
+    return tuple(f.name for f in fields(payload_type))
+
+
+# Plain fields emitted by CombatEvent.to_dict() when they differ from their default
+_EVENT_DICT_FIELDS: tuple[tuple[str, object], ...] = tuple(
+    (f.name, f.default)
+    for f in fields(CombatEvent)
+    if f.init
+    and f.default is not MISSING
+    and f.name not in ("description_args", "dice_values", "payload")
+)
+
+
+@dataclass(slots=True)
 class CombatEventLog:
     """Complete log of combat events for a battle."""
 
@@ -109,17 +422,58 @@ class CombatEventLog:
     victory_condition: str = ""
     total_rounds: int = 0
 
+    # Columnar copies of the fields used for filtering, one entry per event,
+    # so queries scan a packed integer column instead of every event object
+    _type_codes: array = field(default_factory=lambda: array("b"), init=False, repr=False)
+    _round_numbers: array = field(default_factory=lambda: array("h"), init=False, repr=False)
+    # Numeric fields kept as columns for aggregate analysis, see column()
+    _timestamps: array = field(default_factory=lambda: array("i"), init=False, repr=False)
+    _dice_targets: array = field(default_factory=lambda: array("b"), init=False, repr=False)
+    _dice_successes: array = field(default_factory=lambda: array("h"), init=False, repr=False)
+    _dice_failures: array = field(default_factory=lambda: array("h"), init=False, repr=False)
+    _wounds_before: array = field(default_factory=lambda: array("h"), init=False, repr=False)
+    _wounds_after: array = field(default_factory=lambda: array("h"), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for event in self.events:
+            self._index_event(event)
+
+    def _index_event(self, event: CombatEvent) -> None:
+        """Append an event's filter and numeric fields to the columns."""
+        self._type_codes.append(event.event_type)
+        self._round_numbers.append(event.round_number)
+        self._timestamps.append(event.timestamp)
+        self._dice_targets.append(event.dice_target)
+        self._dice_successes.append(event.dice_successes)
+        self._dice_failures.append(event.dice_failures)
+        self._wounds_before.append(event.wounds_before)
+        self._wounds_after.append(event.wounds_after)
+
+    def _events_at(self, indices: NDArray[np.int32]) -> list[CombatEvent]:
+        """Materialize the events at the given positions."""
+        events = self.events
+        return [events[i] for i in indices.tolist()]
+
+    def clear_events(self) -> None:
+        """Remove all events and their column entries."""
+        self.events.clear()
+        for name, _ in _LOG_COLUMNS.values():
+            del getattr(self, name)[:]
+
     def add_event(self, event: CombatEvent) -> None:
         """Add an event to the log."""
         self.events.append(event)
+        self._index_event(event)
 
     def get_events_by_type(self, event_type: CombatEventType) -> list[CombatEvent]:
         """Get all events of a specific type."""
-        return [e for e in self.events if e.event_type == event_type]
+        codes = _int_column(self._type_codes, np.int8)
+        return self._events_at(filter_by_value(codes, np.int8(event_type)))
 
     def get_events_for_round(self, round_number: int) -> list[CombatEvent]:
         """Get all events in a specific round."""
-        return [e for e in self.events if e.round_number == round_number]
+        rounds = _int_column(self._round_numbers, np.int16)
+        return self._events_at(filter_by_value(rounds, np.int16(round_number)))
 
     def get_rule_events(self) -> list[CombatEvent]:
         """Get all events where special rules were triggered."""
@@ -127,14 +481,47 @@ class CombatEventLog:
 
     def get_dice_roll_events(self) -> list[CombatEvent]:
         """Get all dice roll events."""
-        roll_types = [
-            CombatEventType.HIT_ROLL,
-            CombatEventType.DEFENSE_ROLL,
-            CombatEventType.REGENERATION_ROLL,
-            CombatEventType.PROTECTED_ROLL,
-            CombatEventType.MORALE_TEST,
-        ]
-        return [e for e in self.events if e.event_type in roll_types]
+        codes = _int_column(self._type_codes, np.int8)
+        return self._events_at(filter_by_values(codes, _ROLL_CODES))
+
+    def column(self, name: str) -> NDArray:
+        """Get a copy of a numeric event field for all events as a NumPy array.
+
+        name is a CombatEvent field: event_type, round_number, timestamp,
+        dice_target, dice_successes, dice_failures, wounds_before or
+        wounds_after.
+        """
+        try:
+            attr, dtype = _LOG_COLUMNS[name]
+        except KeyError:
+            raise ValueError(f"No column for event field: {name}") from None
+        return _int_column(getattr(self, attr), dtype).copy()
+
+    def to_arrow(self):
+        """Export the events as a pyarrow.Table, one row per event.
+
+        Numeric columns come straight from the log's columns, dice values
+        are binary and unit/model/rule names are dictionary encoded, so no
+        CombatEvent objects are needed to analyze the table.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise RuntimeError(
+                "pyarrow is required for Arrow export. Install with: pip install pyarrow"
+            )
+
+        events = self.events
+        string_type = pa.dictionary(pa.int16(), pa.utf8())
+        columns = {name: pa.array(self.column(name)) for name in _LOG_COLUMNS}
+        columns["dice_values"] = pa.array(
+            [event.dice_values for event in events], type=pa.large_binary()
+        )
+        for name in ("active_unit", "target_unit", "model_name", "rule_name"):
+            columns[name] = pa.array(
+                [getattr(event, name) for event in events], type=string_type
+            )
+        return pa.table(columns)
 
     @property
     def event_count(self) -> int:
@@ -142,16 +529,44 @@ class CombatEventLog:
         return len(self.events)
 
 
+# CombatEvent field -> (CombatEventLog column attribute, element dtype)
+_LOG_COLUMNS: dict[str, tuple[str, type]] = {
+    "event_type": ("_type_codes", np.int8),
+    "round_number": ("_round_numbers", np.int16),
+    "timestamp": ("_timestamps", np.int32),
+    "dice_target": ("_dice_targets", np.int8),
+    "dice_successes": ("_dice_successes", np.int16),
+    "dice_failures": ("_dice_failures", np.int16),
+    "wounds_before": ("_wounds_before", np.int16),
+    "wounds_after": ("_wounds_after", np.int16),
+}
+
+
 class CombatEventRecorder:
-    """Records combat events during a battle for visualization."""
+    """Records combat events during a battle for visualization.
 
-    def __init__(self, attacker_name: str, defender_name: str):
+    Set ``enabled`` to False to skip event creation entirely (e.g. for
+    Monte Carlo runs); the log still receives the battle summary fields.
+    """
+
+    def __init__(
+        self,
+        attacker_name: str,
+        defender_name: str,
+        enabled: bool = True,
+        event_pool: list[CombatEvent] | None = None,
+    ):
         """Initialize the recorder.
 
         Args:
             attacker_name: Name of the attacking unit
             defender_name: Name of the defending unit
+            enabled: Whether events should be recorded
+            event_pool: Optional free list of spent events to reuse; may be
+                shared between recorders that run one after another
         """
+        self.enabled = enabled
+        self._event_pool: list[CombatEvent] = event_pool if event_pool is not None else []
         self.log = CombatEventLog(
             attacker_name=attacker_name,
             defender_name=defender_name,
@@ -162,29 +577,59 @@ class CombatEventRecorder:
         self._current_round = 0
         self._active_unit = ""
         self._target_unit = ""
+        # (active_unit, target_unit) saved by each strike back in progress
+        self._strike_back_stack: list[tuple[str, str]] = []
+        # Canonical instances of repeated names (units, models, weapons, rules)
+        self._strings: dict[str, str] = {}
 
-    def _next_timestamp(self) -> int:
-        """Get the next timestamp and increment."""
-        ts = self._timestamp
-        self._timestamp += 1
-        return ts
+    def _intern(self, value: str) -> str:
+        """Return the shared instance of a repeated name string."""
+        return self._strings.setdefault(value, value)
 
-    def _create_event(
+    def _new_event(
         self,
         event_type: CombatEventType,
-        description: str,
-        **kwargs,
+        description_template: str,
+        description_args: tuple = (),
     ) -> CombatEvent:
-        """Create an event with current context."""
-        return CombatEvent(
-            event_type=event_type,
-            timestamp=self._next_timestamp(),
-            description=description,
-            round_number=self._current_round,
-            active_unit=self._active_unit,
-            target_unit=self._target_unit,
-            **kwargs,
+        """Create an event with current context, reusing a pooled one if available.
+
+        Only the common fields are set here; record_* methods assign the
+        event-specific fields directly on the returned event.
+        """
+        timestamp = self._timestamp
+        self._timestamp = timestamp + 1
+
+        if not self._event_pool:
+            return CombatEvent(
+                event_type,
+                timestamp,
+                description_template,
+                description_args,
+                self._current_round,
+                self._active_unit,
+                self._target_unit,
+            )
+
+        event = self._event_pool.pop()
+        event._reinit(
+            event_type,
+            timestamp,
+            description_template,
+            description_args,
+            self._current_round,
+            self._active_unit,
+            self._target_unit,
         )
+        return event
+
+    def recycle(self, log: CombatEventLog) -> None:
+        """Return a finished log's events to the pool for reuse.
+
+        The log is emptied; only call this once nothing holds on to its events.
+        """
+        self._event_pool.extend(log.events)
+        log.clear_events()
 
     def record_battle_start(
         self,
@@ -199,17 +644,23 @@ class CombatEventRecorder:
         # Store total wounds (default to model count if not provided)
         self.log.attacker_total_wounds = attacker_total_wounds or attacker_models
         self.log.defender_total_wounds = defender_total_wounds or defender_models
+        if not self.enabled:
+            return
 
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.BATTLE_START,
-            f"Battle begins: {self.log.attacker_name} ({attacker_models} models, {self.log.attacker_total_wounds} wounds) "
-            f"vs {self.log.defender_name} ({defender_models} models, {self.log.defender_total_wounds} wounds)",
-            extra_data={
-                "attacker_models": attacker_models,
-                "defender_models": defender_models,
-                "attacker_total_wounds": self.log.attacker_total_wounds,
-                "defender_total_wounds": self.log.defender_total_wounds,
-            },
+            "Battle begins: {} ({} models, {} wounds) "
+            "vs {} ({} models, {} wounds)",
+            (
+                self.log.attacker_name, attacker_models, self.log.attacker_total_wounds,
+                self.log.defender_name, defender_models, self.log.defender_total_wounds,
+            ),
+        )
+        event.payload = BattleStartPayload(
+            attacker_models=attacker_models,
+            defender_models=defender_models,
+            attacker_total_wounds=self.log.attacker_total_wounds,
+            defender_total_wounds=self.log.defender_total_wounds,
         )
         self.log.add_event(event)
 
@@ -226,28 +677,40 @@ class CombatEventRecorder:
         self.log.winner = winner
         self.log.victory_condition = victory_condition
         self.log.total_rounds = self._current_round
+        if not self.enabled:
+            return
+        winner = self._intern(winner)
 
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.BATTLE_END,
-            f"Battle ends: {winner} wins by {victory_condition}. "
-            f"Final: {self.log.attacker_name} {attacker_models} models, "
-            f"{self.log.defender_name} {defender_models} models",
-            extra_data={
-                "winner": winner,
-                "victory_condition": victory_condition,
-                "attacker_models": attacker_models,
-                "defender_models": defender_models,
-            },
+            "Battle ends: {} wins by {}. "
+            "Final: {} {} models, "
+            "{} {} models",
+            (
+                winner, victory_condition,
+                self.log.attacker_name, attacker_models,
+                self.log.defender_name, defender_models,
+            ),
+        )
+        event.payload = BattleEndPayload(
+            winner=winner,
+            victory_condition=victory_condition,
+            attacker_models=attacker_models,
+            defender_models=defender_models,
         )
         self.log.add_event(event)
 
     def record_round_start(self, round_number: int) -> None:
         """Record a new round starting."""
         self._current_round = round_number
-        event = self._create_event(
+        if not self.enabled:
+            return
+        event = self._new_event(
             CombatEventType.ROUND_START,
-            f"Round {round_number} begins",
+            "Round {} begins",
+            (round_number,),
         )
+        event._description = _desc_round_start(round_number)
         self.log.add_event(event)
 
     def record_round_end(
@@ -256,15 +719,22 @@ class CombatEventRecorder:
         defender_wounds_dealt: int,
     ) -> None:
         """Record round ending."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        event = self._new_event(
             CombatEventType.ROUND_END,
-            f"Round {self._current_round} ends. "
-            f"Wounds this round - {self.log.attacker_name}: {attacker_wounds_dealt}, "
-            f"{self.log.defender_name}: {defender_wounds_dealt}",
-            extra_data={
-                "attacker_wounds": attacker_wounds_dealt,
-                "defender_wounds": defender_wounds_dealt,
-            },
+            "Round {} ends. "
+            "Wounds this round - {}: {}, "
+            "{}: {}",
+            (
+                self._current_round,
+                self.log.attacker_name, attacker_wounds_dealt,
+                self.log.defender_name, defender_wounds_dealt,
+            ),
+        )
+        event.payload = RoundEndPayload(
+            attacker_wounds=attacker_wounds_dealt,
+            defender_wounds=defender_wounds_dealt,
         )
         self.log.add_event(event)
 
@@ -275,33 +745,44 @@ class CombatEventRecorder:
         is_fatigued: bool = False,
     ) -> None:
         """Record unit activation starting."""
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
         self._active_unit = unit_name
         fatigue_str = " (fatigued - only hits on 6s)" if is_fatigued else ""
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.ACTIVATION_START,
-            f"{unit_name} activates to {action}{fatigue_str}",
-            extra_data={
-                "action": action,
-                "is_fatigued": is_fatigued,
-            },
+            "{} activates to {}{}",
+            (unit_name, action, fatigue_str),
         )
+        event.payload = ActivationStartPayload(action=action, is_fatigued=is_fatigued)
         self.log.add_event(event)
 
     def record_activation_end(self, unit_name: str) -> None:
         """Record activation ending."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
+        event = self._new_event(
             CombatEventType.ACTIVATION_END,
-            f"{unit_name} finishes activation",
+            "{} finishes activation",
+            (unit_name,),
         )
+        event._description = _desc_activation_end(unit_name)
         self.log.add_event(event)
         self._active_unit = ""
 
     def record_rally(self, unit_name: str) -> None:
         """Record unit rallying."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
+        event = self._new_event(
             CombatEventType.UNIT_RALLIES,
-            f"{unit_name} rallies and removes Shaken status",
+            "{} rallies and removes Shaken status",
+            (unit_name,),
         )
+        event._description = _desc_rally(unit_name)
         self.log.add_event(event)
 
     def record_attack_start(
@@ -312,18 +793,20 @@ class CombatEventRecorder:
         is_charging: bool,
     ) -> None:
         """Record attack sequence starting."""
+        if not self.enabled:
+            return
+        attacker_name = self._intern(attacker_name)
+        defender_name = self._intern(defender_name)
         # Update active and target units to match the current attack
         self._active_unit = attacker_name
         self._target_unit = defender_name
         charge_str = " (charging)" if is_charging else ""
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.ATTACK_START,
-            f"{attacker_name} attacks {defender_name} in {phase}{charge_str}",
-            extra_data={
-                "phase": phase,
-                "is_charging": is_charging,
-            },
+            "{} attacks {} in {}{}",
+            (attacker_name, defender_name, phase, charge_str),
         )
+        event.payload = AttackStartPayload(phase=phase, is_charging=is_charging)
         self.log.add_event(event)
 
     def record_attack_end(
@@ -332,14 +815,14 @@ class CombatEventRecorder:
         models_killed: int,
     ) -> None:
         """Record attack sequence ending."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        event = self._new_event(
             CombatEventType.ATTACK_END,
-            f"Attack complete: {total_wounds} wounds dealt, {models_killed} models killed",
-            extra_data={
-                "total_wounds": total_wounds,
-                "models_killed": models_killed,
-            },
+            "Attack complete: {} wounds dealt, {} models killed",
+            (total_wounds, models_killed),
         )
+        event.payload = AttackEndPayload(total_wounds=total_wounds, models_killed=models_killed)
         self.log.add_event(event)
         self._target_unit = ""
 
@@ -350,14 +833,19 @@ class CombatEventRecorder:
         model_name: str,
     ) -> None:
         """Record weapon attack starting."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        weapon_name = self._intern(weapon_name)
+        model_name = self._intern(model_name)
+        event = self._new_event(
             CombatEventType.WEAPON_ATTACK_START,
-            f"{model_name} attacks with {weapon_name} ({attacks} attacks)",
-            extra_data={
-                "weapon_name": weapon_name,
-                "attacks": attacks,
-                "model_name": model_name,
-            },
+            "{} attacks with {} ({} attacks)",
+            (model_name, weapon_name, attacks),
+        )
+        event.payload = WeaponAttackStartPayload(
+            weapon_name=weapon_name,
+            attacks=attacks,
+            model_name=model_name,
         )
         self.log.add_event(event)
 
@@ -367,43 +855,82 @@ class CombatEventRecorder:
         wounds_dealt: int,
     ) -> None:
         """Record weapon attack ending."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        weapon_name = self._intern(weapon_name)
+        event = self._new_event(
             CombatEventType.WEAPON_ATTACK_END,
-            f"{weapon_name} deals {wounds_dealt} wounds",
-            extra_data={
-                "weapon_name": weapon_name,
-                "wounds_dealt": wounds_dealt,
-            },
+            "{} deals {} wounds",
+            (weapon_name, wounds_dealt),
         )
+        event.payload = WeaponAttackEndPayload(weapon_name=weapon_name, wounds_dealt=wounds_dealt)
         self.log.add_event(event)
 
     def record_hit_roll(
         self,
-        dice_values: list[int] | NDArray[np.int_],
+        dice_values: list[int] | NDArray[np.uint8],
         target: int,
         successes: int,
         is_fatigued: bool = False,
     ) -> None:
-        """Record hit roll."""
+        """Record hit roll from either a dice array or a list of dice.
+
+        Callers that know the type of their dice should use
+        record_hit_roll_arr or record_hit_roll_list directly.
+        """
         if isinstance(dice_values, np.ndarray):
-            dice_list = dice_values.tolist()
+            self.record_hit_roll_arr(dice_values, target, successes, is_fatigued)
         else:
-            dice_list = list(dice_values)
+            self.record_hit_roll_list(dice_values, target, successes, is_fatigued)
 
+    def record_hit_roll_arr(
+        self,
+        dice_values: NDArray[np.uint8],
+        target: int,
+        successes: int,
+        is_fatigued: bool = False,
+    ) -> None:
+        """Record hit roll from a NumPy dice array."""
+        if not self.enabled:
+            return
+        self._add_hit_roll(dice_values.astype(np.uint8, copy=False).tobytes(), target, successes, is_fatigued)
+
+    def record_hit_roll_list(
+        self,
+        dice_values: list[int],
+        target: int,
+        successes: int,
+        is_fatigued: bool = False,
+    ) -> None:
+        """Record hit roll from a list of dice."""
+        if not self.enabled:
+            return
+        self._add_hit_roll(bytes(dice_values), target, successes, is_fatigued)
+
+    def _add_hit_roll(
+        self,
+        dice: bytes,
+        target: int,
+        successes: int,
+        is_fatigued: bool,
+    ) -> None:
         if is_fatigued:
-            desc = f"Hit roll (fatigued - need 6s): {dice_list} -> {successes} hits"
+            template = "Hit roll (fatigued - need 6s): {dice} -> {} hits"
+            args: tuple = (successes,)
         else:
-            desc = f"Hit roll (need {target}+): {dice_list} -> {successes} hits"
+            template = "Hit roll (need {}+): {dice} -> {} hits"
+            args = (target, successes)
 
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.HIT_ROLL,
-            desc,
-            dice_values=dice_list,
-            dice_target=target,
-            dice_successes=successes,
-            dice_failures=len(dice_list) - successes,
-            extra_data={"is_fatigued": is_fatigued},
+            template,
+            args,
         )
+        event.dice_values = dice
+        event.dice_target = target
+        event.dice_successes = successes
+        event.dice_failures = len(dice) - successes
+        event.payload = FatiguePayload(is_fatigued=is_fatigued)
         self.log.add_event(event)
 
     def record_hit_modifier(
@@ -414,49 +941,92 @@ class CombatEventRecorder:
         effect_description: str,
     ) -> None:
         """Record hit modifier being applied (Blast, Furious, etc.)."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        rule_name = self._intern(rule_name)
+        event = self._new_event(
             CombatEventType.HIT_MODIFIER_APPLIED,
-            f"{rule_name}: {effect_description} ({original_hits} -> {modified_hits} hits)",
-            rule_name=rule_name,
-            rule_effect=effect_description,
-            extra_data={
-                "original_hits": original_hits,
-                "modified_hits": modified_hits,
-            },
+            "{}: {} ({} -> {} hits)",
+            (rule_name, effect_description, original_hits, modified_hits),
         )
+        event.rule_name = rule_name
+        event.rule_effect = effect_description
+        event.payload = HitModifierPayload(original_hits=original_hits, modified_hits=modified_hits)
         self.log.add_event(event)
 
     def record_defense_roll(
         self,
-        dice_values: list[int] | NDArray[np.int_],
+        dice_values: list[int] | NDArray[np.uint8],
         target: int,
         ap: int,
         saves: int,
         wounds: int,
         rerolled_sixes: bool = False,
     ) -> None:
-        """Record defense roll."""
+        """Record defense roll from either a dice array or a list of dice.
+
+        Callers that know the type of their dice should use
+        record_defense_roll_arr or record_defense_roll_list directly.
+        """
         if isinstance(dice_values, np.ndarray):
-            dice_list = dice_values.tolist()
+            self.record_defense_roll_arr(dice_values, target, ap, saves, wounds, rerolled_sixes)
         else:
-            dice_list = list(dice_values)
+            self.record_defense_roll_list(dice_values, target, ap, saves, wounds, rerolled_sixes)
+
+    def record_defense_roll_arr(
+        self,
+        dice_values: NDArray[np.uint8],
+        target: int,
+        ap: int,
+        saves: int,
+        wounds: int,
+        rerolled_sixes: bool = False,
+    ) -> None:
+        """Record defense roll from a NumPy dice array."""
+        if not self.enabled:
+            return
+        self._add_defense_roll(
+            dice_values.astype(np.uint8, copy=False).tobytes(), target, ap, saves, wounds, rerolled_sixes
+        )
+
+    def record_defense_roll_list(
+        self,
+        dice_values: list[int],
+        target: int,
+        ap: int,
+        saves: int,
+        wounds: int,
+        rerolled_sixes: bool = False,
+    ) -> None:
+        """Record defense roll from a list of dice."""
+        if not self.enabled:
+            return
+        self._add_defense_roll(bytes(dice_values), target, ap, saves, wounds, rerolled_sixes)
 
-        effective_target = max(2, min(6, target + ap))
+    def _add_defense_roll(
+        self,
+        dice: bytes,
+        target: int,
+        ap: int,
+        saves: int,
+        wounds: int,
+        rerolled_sixes: bool,
+    ) -> None:
+        effective_target = _EFFECTIVE_TARGET.get((target, ap))
+        if effective_target is None:
+            effective_target = max(2, min(6, target + ap))
         reroll_str = " (6s rerolled due to Poison/Bane)" if rerolled_sixes else ""
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.DEFENSE_ROLL,
-            f"Defense roll (need {effective_target}+, base {target}+ with AP {ap}){reroll_str}: "
-            f"{dice_list} -> {saves} saves, {wounds} wounds through",
-            dice_values=dice_list,
-            dice_target=effective_target,
-            dice_successes=saves,
-            dice_failures=wounds,
-            extra_data={
-                "ap": ap,
-                "base_target": target,
-                "rerolled_sixes": rerolled_sixes,
-            },
+            "Defense roll (need {}+, base {}+ with AP {}){}: "
+            "{dice} -> {} saves, {} wounds through",
+            (effective_target, target, ap, reroll_str, saves, wounds),
         )
+        event.dice_values = dice
+        event.dice_target = effective_target
+        event.dice_successes = saves
+        event.dice_failures = wounds
+        event.payload = DefenseRollPayload(ap=ap, base_target=target, rerolled_sixes=rerolled_sixes)
         self.log.add_event(event)
 
     def record_wound_modifier(
@@ -467,15 +1037,19 @@ class CombatEventRecorder:
         effect_description: str,
     ) -> None:
         """Record wound modifier being applied (Deadly, etc.)."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        rule_name = self._intern(rule_name)
+        event = self._new_event(
             CombatEventType.WOUND_MODIFIER_APPLIED,
-            f"{rule_name}: {effect_description} ({original_wounds} -> {modified_wounds} wounds)",
-            rule_name=rule_name,
-            rule_effect=effect_description,
-            extra_data={
-                "original_wounds": original_wounds,
-                "modified_wounds": modified_wounds,
-            },
+            "{}: {} ({} -> {} wounds)",
+            (rule_name, effect_description, original_wounds, modified_wounds),
+        )
+        event.rule_name = rule_name
+        event.rule_effect = effect_description
+        event.payload = WoundModifierPayload(
+            original_wounds=original_wounds,
+            modified_wounds=modified_wounds,
         )
         self.log.add_event(event)
 
@@ -486,14 +1060,18 @@ class CombatEventRecorder:
         effect_description: str,
     ) -> None:
         """Record a special rule being triggered."""
+        if not self.enabled:
+            return
+        rule_name = self._intern(rule_name)
         value_str = f"({rule_value})" if rule_value else ""
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.RULE_TRIGGERED,
-            f"Rule triggered: {rule_name}{value_str} - {effect_description}",
-            rule_name=rule_name,
-            rule_value=rule_value,
-            rule_effect=effect_description,
+            "Rule triggered: {}{} - {}",
+            (rule_name, value_str, effect_description),
         )
+        event.rule_name = rule_name
+        event.rule_value = rule_value
+        event.rule_effect = effect_description
         self.log.add_event(event)
 
     def record_wound_allocated(
@@ -505,31 +1083,35 @@ class CombatEventRecorder:
         tough: int,
     ) -> None:
         """Record wound being allocated to a model."""
+        if not self.enabled:
+            return
+        model_name = self._intern(model_name)
         remaining = tough - wounds_after
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.WOUND_ALLOCATED,
-            f"{model_name} takes {wounds} wound(s) ({wounds_before}/{tough} -> {wounds_after}/{tough}, "
-            f"{remaining} remaining)",
-            model_name=model_name,
-            wounds_before=wounds_before,
-            wounds_after=wounds_after,
-            extra_data={
-                "wounds_applied": wounds,
-                "tough": tough,
-                "remaining": remaining,
-            },
+            "{} takes {} wound(s) ({}/{} -> {}/{}, "
+            "{} remaining)",
+            (model_name, wounds, wounds_before, tough, wounds_after, tough, remaining),
         )
+        event.model_name = model_name
+        event.wounds_before = wounds_before
+        event.wounds_after = wounds_after
+        event.payload = WoundAllocatedPayload(wounds_applied=wounds, tough=tough, remaining=remaining)
         self.log.add_event(event)
 
     def record_model_killed(self, model_name: str, overkill: int = 0) -> None:
         """Record a model being killed."""
+        if not self.enabled:
+            return
+        model_name = self._intern(model_name)
         overkill_str = f" ({overkill} overkill wounds)" if overkill > 0 else ""
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.MODEL_KILLED,
-            f"{model_name} is killed!{overkill_str}",
-            model_name=model_name,
-            extra_data={"overkill": overkill},
+            "{} is killed!{}",
+            (model_name, overkill_str),
         )
+        event.model_name = model_name
+        event.payload = ModelKilledPayload(overkill=overkill)
         self.log.add_event(event)
 
     def record_regeneration_roll(
@@ -540,16 +1122,20 @@ class CombatEventRecorder:
         success: bool,
     ) -> None:
         """Record a regeneration roll."""
+        if not self.enabled:
+            return
+        model_name = self._intern(model_name)
         result = "wound ignored" if success else "wound taken"
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.REGENERATION_ROLL,
-            f"{model_name} Regeneration roll (need {target}+): rolled {roll} -> {result}",
-            model_name=model_name,
-            dice_values=[roll],
-            dice_target=target,
-            dice_successes=1 if success else 0,
-            dice_failures=0 if success else 1,
+            "{} Regeneration roll (need {}+): rolled {} -> {}",
+            (model_name, target, roll, result),
         )
+        event.model_name = model_name
+        event.dice_values = bytes((roll,))
+        event.dice_target = target
+        event.dice_successes = 1 if success else 0
+        event.dice_failures = 0 if success else 1
         self.log.add_event(event)
 
     def record_protected_roll(
@@ -560,16 +1146,20 @@ class CombatEventRecorder:
         success: bool,
     ) -> None:
         """Record a Protected roll."""
+        if not self.enabled:
+            return
+        model_name = self._intern(model_name)
         result = "wound ignored" if success else "wound taken"
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.PROTECTED_ROLL,
-            f"{model_name} Protected roll (need {target}+): rolled {roll} -> {result}",
-            model_name=model_name,
-            dice_values=[roll],
-            dice_target=target,
-            dice_successes=1 if success else 0,
-            dice_failures=0 if success else 1,
+            "{} Protected roll (need {}+): rolled {} -> {}",
+            (model_name, target, roll, result),
         )
+        event.model_name = model_name
+        event.dice_values = bytes((roll,))
+        event.dice_target = target
+        event.dice_successes = 1 if success else 0
+        event.dice_failures = 0 if success else 1
         self.log.add_event(event)
 
     def record_morale_test(
@@ -581,44 +1171,60 @@ class CombatEventRecorder:
         result: str,
     ) -> None:
         """Record a morale test."""
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
         success = roll >= target
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.MORALE_TEST,
-            f"{unit_name} morale test ({reason}, need {target}+): "
-            f"rolled {roll} -> {result}",
-            dice_values=[roll],
-            dice_target=target,
-            dice_successes=1 if success else 0,
-            dice_failures=0 if success else 1,
-            extra_data={
-                "reason": reason,
-                "result": result,
-            },
+            "{} morale test ({}, need {}+): "
+            "rolled {} -> {}",
+            (unit_name, reason, target, roll, result),
         )
+        event.dice_values = bytes((roll,))
+        event.dice_target = target
+        event.dice_successes = 1 if success else 0
+        event.dice_failures = 0 if success else 1
+        event.payload = MoraleTestPayload(reason=reason, result=result)
         self.log.add_event(event)
 
     def record_unit_shaken(self, unit_name: str) -> None:
         """Record unit becoming shaken."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
+        event = self._new_event(
             CombatEventType.UNIT_SHAKEN,
-            f"{unit_name} becomes Shaken! (-1 to Quality and Defense)",
+            "{} becomes Shaken! (-1 to Quality and Defense)",
+            (unit_name,),
         )
+        event._description = _desc_shaken(unit_name)
         self.log.add_event(event)
 
     def record_unit_routed(self, unit_name: str) -> None:
         """Record unit routing."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
+        event = self._new_event(
             CombatEventType.UNIT_ROUTED,
-            f"{unit_name} is Routed and flees the battle!",
+            "{} is Routed and flees the battle!",
+            (unit_name,),
         )
+        event._description = _desc_routed(unit_name)
         self.log.add_event(event)
 
     def record_unit_fatigued(self, unit_name: str) -> None:
         """Record unit becoming fatigued."""
-        event = self._create_event(
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
+        event = self._new_event(
             CombatEventType.UNIT_FATIGUED,
-            f"{unit_name} becomes Fatigued (only hits on unmodified 6s in melee)",
+            "{} becomes Fatigued (only hits on unmodified 6s in melee)",
+            (unit_name,),
         )
+        event._description = _desc_fatigued(unit_name)
         self.log.add_event(event)
 
     def record_strike_back_start(self, unit_name: str, is_fatigued: bool) -> None:
@@ -627,20 +1233,23 @@ class CombatEventRecorder:
         Updates _active_unit and _target_unit so that subsequent wound/kill
         events correctly reflect the striking unit as the attacker.
         """
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
         # Save original values to restore after strike back ends
-        self._pre_strike_back_active_unit = self._active_unit
-        self._pre_strike_back_target_unit = self._target_unit
+        self._strike_back_stack.append((self._active_unit, self._target_unit))
 
         # Swap: the unit that was being attacked is now attacking
         self._target_unit = self._active_unit  # Original attacker is now target
         self._active_unit = unit_name  # Striking unit is now active
 
         fatigue_str = " (as fatigued)" if is_fatigued else ""
-        event = self._create_event(
+        event = self._new_event(
             CombatEventType.STRIKE_BACK_START,
-            f"{unit_name} strikes back{fatigue_str}!",
-            extra_data={"is_fatigued": is_fatigued},
+            "{} strikes back{}!",
+            (unit_name, fatigue_str),
         )
+        event.payload = FatiguePayload(is_fatigued=is_fatigued)
         self.log.add_event(event)
 
     def record_strike_back_end(
@@ -653,24 +1262,45 @@ class CombatEventRecorder:
 
         Restores _active_unit and _target_unit to their pre-strike-back values.
         """
-        event = self._create_event(
+        if not self.enabled:
+            return
+        unit_name = self._intern(unit_name)
+        event = self._new_event(
             CombatEventType.STRIKE_BACK_END,
-            f"{unit_name} strike back complete: {wounds_dealt} wounds, {models_killed} kills",
-            extra_data={
-                "wounds_dealt": wounds_dealt,
-                "models_killed": models_killed,
-            },
+            "{} strike back complete: {} wounds, {} kills",
+            (unit_name, wounds_dealt, models_killed),
         )
+        event.payload = StrikeBackEndPayload(wounds_dealt=wounds_dealt, models_killed=models_killed)
         self.log.add_event(event)
 
         # Restore original active/target units
-        if hasattr(self, "_pre_strike_back_active_unit"):
-            self._active_unit = self._pre_strike_back_active_unit
-            del self._pre_strike_back_active_unit
-        if hasattr(self, "_pre_strike_back_target_unit"):
-            self._target_unit = self._pre_strike_back_target_unit
-            del self._pre_strike_back_target_unit
+        if self._strike_back_stack:
+            self._active_unit, self._target_unit = self._strike_back_stack.pop()
 
     def get_log(self) -> CombatEventLog:
         """Get the completed event log."""
         return self.log
+
+
+class NullCombatEventRecorder(CombatEventRecorder):
+    """Recorder whose record_* methods do nothing.
+
+    Drop-in for callers that need a recorder but never read the events.
+    """
+
+    def __init__(self, attacker_name: str = "", defender_name: str = ""):
+        super().__init__(attacker_name, defender_name, enabled=False)
+
+
+def _ignore_event(self, *args, **kwargs) -> None:
+    return
+
+
+# Stub out every record_* method so new recorder methods are covered automatically
+for _name in list(vars(CombatEventRecorder)):
+    if _name.startswith("record_"):
+        setattr(NullCombatEventRecorder, _name, _ignore_event)
+del _name
+
+# Shared no-op recorder for callers that were not given a recorder
+NULL_RECORDER = NullCombatEventRecorder()
@@ -80,6 +80,12 @@ class UnitCombatState:
         self.wounds_dealt_this_activation = 0
         self.wounds_taken_this_activation = 0
 
+    def reset(self) -> None:
+        """Reset all combat state so the tracker can be reused for a new fight."""
+        self.status = UnitStatus.NORMAL
+        self.is_engaged_in_melee = False
+        self.reset_round_state()
+
     def become_shaken(self) -> None:
         """Set unit status to shaken."""
         self.status = UnitStatus.SHAKEN
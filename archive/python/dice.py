@@ -1,8 +1,64 @@
 """Dice rolling engine using NumPy for efficient vectorized operations."""
 
+import os
+import threading
+
 import numpy as np
 from numpy.typing import NDArray
 
+from src.engine.dice_kernels import (
+    LANES_MIN_COUNT,
+    count_d6_packed,
+    new_xoshiro_lanes,
+    new_xoshiro_state,
+    new_xoshiro_streams,
+    parallel_streams,
+    roll_d6_lanes,
+    roll_d6_packed,
+    simulate_attacks_parallel,
+)
+
+# Defense target after AP and modifiers, clamped to 2+..6+, for the usual
+# input ranges; roll_defense_test falls back to the clamp outside them
+_EFFECTIVE_DEFENSE: dict[tuple[int, int, int], int] = {
+    (defense, ap, modifier): max(2, min(6, defense + ap - modifier))
+    for defense in range(2, 7)
+    for ap in range(0, 6)
+    for modifier in range(-2, 3)
+}
+
+
+class DicePool:
+    """Pre-rolled dice handed out in order, so each die is used only once.
+
+    Created by DiceRoller.roll_batch. take() advances a cursor through the
+    dice and raises once the pool runs short, rather than reusing dice.
+    """
+
+    __slots__ = ("_dice", "_cursor")
+
+    def __init__(self, dice: NDArray[np.uint8]):
+        self._dice = dice
+        self._cursor = 0
+
+    @property
+    def remaining(self) -> int:
+        """Number of dice not yet taken."""
+        return len(self._dice) - self._cursor
+
+    def take(self, count: int) -> NDArray[np.uint8]:
+        """Take the next count dice from the pool.
+
+        Raises:
+            ValueError: If fewer than count dice remain
+        """
+        start = self._cursor
+        end = start + count
+        if end > len(self._dice):
+            raise ValueError(f"Dice pool has {len(self._dice) - start} dice left, {count} needed")
+        self._cursor = end
+        return self._dice[start:end]
+
 
 class DiceRoller:
     """High-performance dice roller using NumPy.
@@ -17,22 +73,68 @@ class DiceRoller:
         Args:
             seed: Optional random seed for reproducibility
         """
-        self.rng = np.random.default_rng(seed)
+        self._init_streams(np.random.default_rng(seed))
 
-    def roll_d6(self, count: int = 1) -> NDArray[np.int_]:
+    @classmethod
+    def from_rng(cls, rng: np.random.Generator) -> "DiceRoller":
+        """Create a dice roller drawing from an existing NumPy generator.
+
+        Args:
+            rng: Generator to use; it is not copied
+        """
+        roller = cls.__new__(cls)
+        roller._init_streams(rng)
+        return roller
+
+    def _init_streams(self, rng: np.random.Generator) -> None:
+        self.rng = rng
+        # Packed xoshiro256++ streams for roll_d6 when Numba is available:
+        # one for small rolls and a set of parallel lanes for large ones
+        self._xoshiro = None
+        self._xoshiro_lanes = None
+        if roll_d6_packed is not None:
+            self._xoshiro = new_xoshiro_state(self.rng)
+            self._xoshiro_lanes = new_xoshiro_lanes(self._xoshiro)
+
+    def roll_d6(self, count: int = 1) -> NDArray[np.uint8]:
         """Roll multiple D6 dice.
 
         Args:
             count: Number of dice to roll
 
         Returns:
-            Array of dice results (1-6)
+            Array of dice results (1-6), one byte per die
         """
         if count <= 0:
-            return np.array([], dtype=np.int_)
-        return self.rng.integers(1, 7, size=count)
+            return np.array([], dtype=np.uint8)
+        if self._xoshiro is None:
+            return self.rng.integers(1, 7, size=count, dtype=np.uint8)
+        rolls = np.empty(count, dtype=np.uint8)
+        self._roll_packed(rolls, 7)
+        return rolls
+
+    def _roll_packed(self, out: NDArray[np.uint8], target: int) -> int:
+        """Fill out from the xoshiro streams and count dice >= target."""
+        if len(out) >= LANES_MIN_COUNT:
+            return roll_d6_lanes(out, self._xoshiro_lanes, target)
+        return roll_d6_packed(out, self._xoshiro, target)
+
+    def roll_batch(self, total_count: int) -> DicePool:
+        """Roll every die needed for a sequence of tests in one RNG call.
+
+        The pool can be handed to the tests that accept one (reroll_failures,
+        reroll_ones) instead of each of them calling into the RNG
+        separately; each test takes the next unused dice from it.
+
+        Args:
+            total_count: Upper bound on the number of dice the sequence needs
+
+        Returns:
+            DicePool of dice results (1-6)
+        """
+        return DicePool(self.roll_d6(total_count))
 
-    def roll_d6_target(self, count: int, target: int) -> tuple[int, NDArray[np.int_]]:
+    def roll_d6_target(self, count: int, target: int) -> tuple[int, NDArray[np.uint8]]:
         """Roll dice and count successes against a target number.
 
         Args:
@@ -43,15 +145,37 @@ class DiceRoller:
             Tuple of (number of successes, array of all rolls)
         """
         if count <= 0:
-            return 0, np.array([], dtype=np.int_)
+            return 0, np.array([], dtype=np.uint8)
+
+        if self._xoshiro is not None:
+            # The kernel counts successes while generating
+            rolls = np.empty(count, dtype=np.uint8)
+            successes = self._roll_packed(rolls, target)
+            return successes, rolls
 
         rolls = self.roll_d6(count)
-        successes = int(np.sum(rolls >= target))
+        successes = int(np.count_nonzero(rolls >= target))
         return successes, rolls
 
+    def roll_d6_successes(self, count: int, target: int) -> int:
+        """Roll dice and count successes, for callers that don't need the rolls.
+
+        Args:
+            count: Number of dice to roll
+            target: Target number to meet or exceed (e.g., 4 for 4+)
+
+        Returns:
+            Number of successes
+        """
+        if count <= 0:
+            return 0
+        if self._xoshiro is not None:
+            return count_d6_packed(count, self._xoshiro, target)
+        return int(np.count_nonzero(self.rng.integers(1, 7, size=count, dtype=np.uint8) >= target))
+
     def roll_quality_test(
         self, attacks: int, quality: int, modifier: int = 0
-    ) -> tuple[int, NDArray[np.int_]]:
+    ) -> tuple[int, NDArray[np.uint8]]:
         """Roll to hit with quality modifier.
 
         Args:
@@ -69,7 +193,7 @@ class DiceRoller:
     def roll_defense_test(
         self, hits: int, defense: int, ap: int = 0, modifier: int = 0,
         reroll_sixes: bool = False
-    ) -> tuple[int, NDArray[np.int_]]:
+    ) -> tuple[int, NDArray[np.uint8]]:
         """Roll defense saves.
 
         Args:
@@ -84,29 +208,97 @@ class DiceRoller:
         """
         # AP increases the target number needed
         # Modifier: positive is good for defender (cover), negative is bad (shaken)
-        effective_defense = defense + ap - modifier
-
         # Clamp to valid range: rolls of 1 always fail, rolls of 6 always succeed
         # Target cannot go below 2 (1s always fail) or above 6 (6s always succeed)
-        effective_defense = max(2, min(6, effective_defense))
-
-        successes, rolls = self.roll_d6_target(hits, effective_defense)
-
-        # Poison: Reroll unmodified results of 6 (successful saves on 6)
-        if reroll_sixes and len(rolls) > 0:
+        effective_defense = _EFFECTIVE_DEFENSE.get((defense, ap, modifier))
+        if effective_defense is None:
+            effective_defense = max(2, min(6, defense + ap - modifier))
+
+        if not reroll_sixes:
+            successes, rolls = self.roll_d6_target(hits, effective_defense)
+            return hits - successes, rolls
+
+        # Poison: Reroll unmodified results of 6 (successful saves on 6).
+        # At most every die is rerolled, so draw the saves and the rerolls
+        # together and take the rerolls from the tail.
+        batch = self.roll_batch(2 * hits)
+        rolls = batch[:hits]
+        successes = int(np.count_nonzero(rolls >= effective_defense))
+        if len(rolls) > 0:
             sixes_mask = rolls == 6
-            num_sixes = np.sum(sixes_mask)
+            num_sixes = int(np.count_nonzero(sixes_mask))
             if num_sixes > 0:
                 # Reroll the 6s
-                rerolls = self.roll_d6(int(num_sixes))
+                rerolls = batch[hits:hits + num_sixes]
                 rolls[sixes_mask] = rerolls
-                # Recalculate successes
-                successes = int(np.sum(rolls >= effective_defense))
+                # Every 6 was a success; only the rerolled dice can change that
+                successes += int(np.count_nonzero(rerolls >= effective_defense)) - num_sixes
 
         wounds = hits - successes  # Failed saves = wounds
         return wounds, rolls
 
-    def roll_regeneration(self, wounds: int, target: int = 5) -> tuple[int, NDArray[np.int_]]:
+    def simulate_attacks(
+        self,
+        n_trials: int,
+        attacks: int,
+        quality: int,
+        defense: int,
+        ap: int = 0,
+        quality_modifier: int = 0,
+        defense_modifier: int = 0,
+        reroll_sixes: bool = False,
+    ) -> NDArray[np.int_]:
+        """Simulate many independent hit + defense sequences at once.
+
+        Equivalent to calling roll_quality_test followed by roll_defense_test
+        n_trials times. With Numba, trials run in parallel threads in
+        fixed-size blocks with one xoshiro stream each; otherwise every
+        trial is rolled in one 2D NumPy pass, one row per trial, with
+        defense dice beyond a trial's hit count masked out.
+
+        Args:
+            n_trials: Number of independent trials
+            attacks: Number of attacks per trial
+            quality: Attacker quality value
+            defense: Defender defense value
+            ap: Armor Piercing value
+            quality_modifier: Modifier to the hit roll (see roll_quality_test)
+            defense_modifier: Modifier to the defense roll (see roll_defense_test)
+            reroll_sixes: If True, defense 6s are rerolled (Poison)
+
+        Returns:
+            Array of wounds caused, one per trial
+        """
+        if n_trials <= 0:
+            return np.empty(0, dtype=np.int_)
+
+        quality_target = max(2, min(6, quality - quality_modifier))
+        defense_target = max(2, min(6, defense + ap - defense_modifier))
+
+        if simulate_attacks_parallel is not None:
+            wounds = np.empty(n_trials, dtype=np.int_)
+            # Fresh streams per call, so repeated calls don't replay the same dice
+            streams = new_xoshiro_streams(new_xoshiro_state(self.rng), parallel_streams(n_trials))
+            simulate_attacks_parallel(
+                wounds, max(attacks, 0), quality_target, defense_target, reroll_sixes, streams
+            )
+            return wounds
+
+        attack_rolls = self.rng.integers(1, 7, size=(n_trials, max(attacks, 0)), dtype=np.uint8)
+        hits = np.count_nonzero(attack_rolls >= quality_target, axis=1)
+        max_hits = int(hits.max())
+
+        defense_rolls = self.rng.integers(1, 7, size=(n_trials, max_hits), dtype=np.uint8)
+        if reroll_sixes:
+            rerolls = self.rng.integers(1, 7, size=(n_trials, max_hits), dtype=np.uint8)
+            defense_rolls = np.where(defense_rolls == 6, rerolls, defense_rolls)
+
+        # Column j of a trial is a real die only if the trial scored more than j hits
+        valid = np.arange(max_hits) < hits[:, None]
+        saves = np.count_nonzero((defense_rolls >= defense_target) & valid, axis=1)
+        return hits - saves
+
+    def roll_regeneration(self, wounds: int, target: int = 5) -> tuple[int, NDArray[np.uint8]]:
         """Roll regeneration saves.
 
         Args:
@@ -117,13 +309,13 @@ class DiceRoller:
             Tuple of (wounds remaining after regen, all rolls)
         """
         if wounds <= 0:
-            return 0, np.array([], dtype=np.int_)
+            return 0, np.array([], dtype=np.uint8)
 
         successes, rolls = self.roll_d6_target(wounds, target)
         remaining_wounds = wounds - successes
         return remaining_wounds, rolls
 
-    def count_sixes(self, rolls: NDArray[np.int_]) -> int:
+    def count_sixes(self, rolls: NDArray[np.uint8]) -> int:
         """Count natural 6s in a set of rolls.
 
         Used for Rending and other "on 6" effects.
@@ -134,9 +326,9 @@ class DiceRoller:
         Returns:
             Number of 6s rolled
         """
-        return int(np.sum(rolls == 6))
+        return int(np.count_nonzero(rolls == 6))
 
-    def count_ones(self, rolls: NDArray[np.int_]) -> int:
+    def count_ones(self, rolls: NDArray[np.uint8]) -> int:
         """Count natural 1s in a set of rolls.
 
         Used for effects that trigger on 1s.
@@ -147,88 +339,107 @@ class DiceRoller:
         Returns:
             Number of 1s rolled
         """
-        return int(np.sum(rolls == 1))
+        return int(np.count_nonzero(rolls == 1))
 
     def reroll_failures(
-        self, rolls: NDArray[np.int_], target: int
-    ) -> tuple[NDArray[np.int_], int]:
+        self, rolls: NDArray[np.uint8], target: int, pool: DicePool | None = None
+    ) -> tuple[NDArray[np.uint8], int]:
         """Reroll failed dice.
 
         Args:
             rolls: Original dice results
             target: Target number
+            pool: Optional DicePool from roll_batch to take the rerolls from;
+                one die is taken per die in rolls
 
         Returns:
             Tuple of (new rolls array with rerolls, additional successes from rerolls)
         """
         failures = rolls < target
-        num_rerolls = int(np.sum(failures))
-
-        if num_rerolls == 0:
+        if not failures.any():
             return rolls, 0
 
-        rerolls = self.roll_d6(num_rerolls)
-        new_successes = int(np.sum(rerolls >= target))
-
-        # Create new array with rerolls substituted
-        new_rolls = rolls.copy()
-        new_rolls[failures] = rerolls
+        # Draw a reroll for every position and keep the ones over failures,
+        # rather than counting failures and scattering into a copy
+        rerolls = self._take_rerolls(len(rolls), pool)
+        new_rolls = np.where(failures, rerolls, rolls)
+        new_successes = int(np.count_nonzero(failures & (rerolls >= target)))
 
         return new_rolls, new_successes
 
-    def reroll_ones(self, rolls: NDArray[np.int_], target: int) -> tuple[NDArray[np.int_], int]:
+    def reroll_ones(
+        self, rolls: NDArray[np.uint8], target: int, pool: DicePool | None = None
+    ) -> tuple[NDArray[np.uint8], int]:
         """Reroll only 1s.
 
         Args:
             rolls: Original dice results
             target: Target number for determining additional successes
+            pool: Optional DicePool from roll_batch to take the rerolls from;
+                one die is taken per die in rolls
 
         Returns:
             Tuple of (new rolls array with rerolls, additional successes from rerolls)
         """
         ones = rolls == 1
-        num_rerolls = int(np.sum(ones))
-
-        if num_rerolls == 0:
+        if not ones.any():
             return rolls, 0
 
-        rerolls = self.roll_d6(num_rerolls)
-        new_successes = int(np.sum(rerolls >= target))
-
-        new_rolls = rolls.copy()
-        new_rolls[ones] = rerolls
+        rerolls = self._take_rerolls(len(rolls), pool)
+        new_rolls = np.where(ones, rerolls, rolls)
+        new_successes = int(np.count_nonzero(ones & (rerolls >= target)))
 
         return new_rolls, new_successes
 
+    def _take_rerolls(self, count: int, pool: DicePool | None) -> NDArray[np.uint8]:
+        """Get count reroll dice from a pre-rolled pool, or roll them if none given."""
+        if pool is None:
+            return self.roll_d6(count)
+        return pool.take(count)
+
+
+# Per-thread unseeded dice rollers handed out by get_dice_roller()
+_thread_rollers = threading.local()
+
 
 def get_dice_roller(seed: int | None = None) -> DiceRoller:
-    """Create a new dice roller instance.
+    """Get a dice roller for the current thread.
+
+    Without a seed, each thread reuses one persistent roller instead of
+    seeding a new generator from OS entropy on every call; threads never
+    share a roller, so concurrent simulations don't race on RNG state.
+    A roller should not be handed to another thread. Forked worker
+    processes get fresh rollers rather than copies of the parent's.
 
-    This function always creates a new DiceRoller instance to ensure
-    thread-safety in concurrent environments. Each simulation/request
-    should use its own dice roller to avoid race conditions.
+    With a seed, a new DiceRoller is always created for reproducibility.
 
     Args:
         seed: Optional seed for reproducibility
 
     Returns:
-        A new DiceRoller instance
+        A DiceRoller instance
     """
-    return DiceRoller(seed)
+    if seed is not None:
+        return DiceRoller(seed)
+    pid = os.getpid()
+    if getattr(_thread_rollers, "pid", None) != pid:
+        _thread_rollers.roller = DiceRoller()
+        _thread_rollers.pid = pid
+    return _thread_rollers.roller
 
 
-def roll_d6(count: int = 1) -> NDArray[np.int_]:
+def roll_d6(count: int = 1) -> NDArray[np.uint8]:
     """Convenience function to roll D6s using default roller."""
     return get_dice_roller().roll_d6(count)
 
 
-def roll_quality(attacks: int, quality: int, modifier: int = 0) -> tuple[int, NDArray[np.int_]]:
+def roll_quality(attacks: int, quality: int, modifier: int = 0) -> tuple[int, NDArray[np.uint8]]:
     """Convenience function for quality tests."""
     return get_dice_roller().roll_quality_test(attacks, quality, modifier)
 
 
 def roll_defense(
     hits: int, defense: int, ap: int = 0, modifier: int = 0
-) -> tuple[int, NDArray[np.int_]]:
+) -> tuple[int, NDArray[np.uint8]]:
     """Convenience function for defense tests."""
     return get_dice_roller().roll_defense_test(hits, defense, ap, modifier)
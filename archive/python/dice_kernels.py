@@ -0,0 +1,251 @@
+"""Compiled d6 generators for DiceRoller.
+
+Dice come from a xoshiro256++ stream held in a 4-element uint64 state
+array. Each 64-bit output is cut into 21 three-bit fields; fields of 0
+and 7 are rejected and the rest are used as d6 results, giving about 15
+dice per generator step instead of one.
+
+For large rolls, roll_d6_lanes steps LANES independent xoshiro streams
+together (each one a jump of 2^128 outputs ahead of the previous one)
+in loops simple enough for LLVM to vectorize across the lanes.
+
+simulate_attacks_parallel runs whole hit + defense trials in parallel
+threads, in fixed-size blocks that each have their own jumped stream.
+
+Only available when Numba is installed; the kernels are None otherwise
+and DiceRoller falls back to NumPy's generator.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Three-bit fields per 64-bit word
+FIELDS_PER_WORD = 21
+
+# Parallel streams stepped together by roll_d6_lanes
+LANES = 8
+
+# Rolls of at least this many dice go through roll_d6_lanes
+LANES_MIN_COUNT = 64
+
+# Trials per stream in simulate_attacks_parallel. Fixed rather than tied
+# to the thread count, so a seeded roller gives the same results anywhere.
+TRIALS_PER_STREAM = 256
+
+# xoshiro256 jump polynomial, equivalent to 2^128 calls to next_xoshiro
+_JUMP = np.array(
+    [0x180EC6D33CFD0ABA, 0xD5A61266F0C9392C, 0xA9582618E03FC9AA, 0x39ABDC4529B1661C],
+    dtype=np.uint64,
+)
+
+
+def new_xoshiro_state(rng: np.random.Generator) -> NDArray[np.uint64]:
+    """Seed a xoshiro256++ state from a NumPy generator."""
+    state = rng.bit_generator.random_raw(4).astype(np.uint64)
+    if not state.any():
+        # The all-zero state is a fixed point of the generator
+        state[0] = 1
+    return state
+
+
+if njit is not None:
+
+    _SHIFT_3 = np.uint64(3)
+    _SHIFT_17 = np.uint64(17)
+    _ROTATE_23 = np.uint64(23)
+    _ROTATE_45 = np.uint64(45)
+    _WORD_BITS = np.uint64(64)
+    _FIELD_MASK = np.uint64(7)
+
+    @njit(cache=True)
+    def _rotl(x, k):
+        return (x << k) | (x >> (_WORD_BITS - k))
+
+    @njit(cache=True)
+    def next_xoshiro(state):
+        """Advance a xoshiro256++ state in place and return its next output."""
+        s0 = state[0]
+        s1 = state[1]
+        s2 = state[2]
+        s3 = state[3]
+        result = _rotl(s0 + s3, _ROTATE_23) + s0
+        t = s1 << _SHIFT_17
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
+        s2 ^= t
+        s3 = _rotl(s3, _ROTATE_45)
+        state[0] = s0
+        state[1] = s1
+        state[2] = s2
+        state[3] = s3
+        return result
+
+    @njit(cache=True)
+    def roll_d6_packed(out, state, target):
+        """Fill out with d6 results and count the dice that are >= target."""
+        n = out.shape[0]
+        k = 0
+        successes = 0
+        while k < n:
+            word = next_xoshiro(state)
+            for _ in range(FIELDS_PER_WORD):
+                value = np.int64(word & _FIELD_MASK)
+                word >>= _SHIFT_3
+                if value != 0 and value != 7:
+                    out[k] = value
+                    if value >= target:
+                        successes += 1
+                    k += 1
+                    if k == n:
+                        break
+        return successes
+
+    @njit(cache=True)
+    def count_d6_packed(n, state, target):
+        """Roll n d6 and count the dice that are >= target without storing them."""
+        k = 0
+        successes = 0
+        while k < n:
+            word = next_xoshiro(state)
+            for _ in range(FIELDS_PER_WORD):
+                value = np.int64(word & _FIELD_MASK)
+                word >>= _SHIFT_3
+                if value != 0 and value != 7:
+                    if value >= target:
+                        successes += 1
+                    k += 1
+                    if k == n:
+                        break
+        return successes
+
+    @njit(cache=True)
+    def _jump(state):
+        """Advance a xoshiro256++ state in place by 2^128 steps."""
+        jumped = np.zeros(4, dtype=np.uint64)
+        for i in range(4):
+            for bit in range(64):
+                if (_JUMP[i] >> np.uint64(bit)) & np.uint64(1):
+                    jumped ^= state
+                next_xoshiro(state)
+        state[:] = jumped
+
+    @njit(cache=True)
+    def new_xoshiro_streams(state, count):
+        """Build count non-overlapping states, one per row, from consecutive jumps of state."""
+        streams = np.empty((count, 4), dtype=np.uint64)
+        stream_state = state.copy()
+        for i in range(count):
+            _jump(stream_state)
+            streams[i] = stream_state
+        return streams
+
+    @njit(cache=True)
+    def new_xoshiro_lanes(state):
+        """Build a (4, LANES) state for roll_d6_lanes from consecutive jumps of state."""
+        return new_xoshiro_streams(state, LANES).T.copy()
+
+    @njit(cache=True)
+    def _step_lanes(lanes, words):
+        """Advance every lane once, writing each lane's output to words."""
+        s0 = lanes[0]
+        s1 = lanes[1]
+        s2 = lanes[2]
+        s3 = lanes[3]
+        for lane in range(LANES):
+            words[lane] = _rotl(s0[lane] + s3[lane], _ROTATE_23) + s0[lane]
+            t = s1[lane] << _SHIFT_17
+            s2[lane] ^= s0[lane]
+            s3[lane] ^= s1[lane]
+            s1[lane] ^= s2[lane]
+            s0[lane] ^= s3[lane]
+            s2[lane] ^= t
+            s3[lane] = _rotl(s3[lane], _ROTATE_45)
+
+    @njit(cache=True)
+    def roll_d6_lanes(out, lanes, target):
+        """Like roll_d6_packed, drawing LANES words per step from a lane state."""
+        n = out.shape[0]
+        words = np.empty(LANES, dtype=np.uint64)
+        values = np.empty(LANES, dtype=np.int64)
+        k = 0
+        successes = 0
+        while k < n:
+            _step_lanes(lanes, words)
+            for _ in range(FIELDS_PER_WORD):
+                for lane in range(LANES):
+                    values[lane] = np.int64(words[lane] & _FIELD_MASK)
+                    words[lane] >>= _SHIFT_3
+                for lane in range(LANES):
+                    value = values[lane]
+                    if value != 0 and value != 7:
+                        out[k] = value
+                        if value >= target:
+                            successes += 1
+                        k += 1
+                        if k == n:
+                            return successes
+        return successes
+
+    @njit(cache=True)
+    def _count_d6_and_sixes(n, state, target):
+        """Roll n d6 and count the dice >= target and the 6s among them."""
+        k = 0
+        successes = 0
+        sixes = 0
+        while k < n:
+            word = next_xoshiro(state)
+            for _ in range(FIELDS_PER_WORD):
+                value = np.int64(word & _FIELD_MASK)
+                word >>= _SHIFT_3
+                if value != 0 and value != 7:
+                    if value >= target:
+                        successes += 1
+                    if value == 6:
+                        sixes += 1
+                    k += 1
+                    if k == n:
+                        break
+        return successes, sixes
+
+    @njit(parallel=True, cache=True)
+    def simulate_attacks_parallel(out, attacks, quality_target, defense_target, reroll_sixes, streams):
+        """Fill out with the wounds of len(out) independent hit + defense trials.
+
+        Trials are split into contiguous blocks of TRIALS_PER_STREAM, one per
+        row of streams, and the blocks run in parallel, each drawing from
+        its own stream.
+        """
+        n = out.shape[0]
+        for block in prange(streams.shape[0]):
+            state = streams[block]
+            end = min(n, (block + 1) * TRIALS_PER_STREAM)
+            for trial in range(block * TRIALS_PER_STREAM, end):
+                hits = count_d6_packed(attacks, state, quality_target)
+                if reroll_sixes:
+                    # Poison: 6s are rerolled once and only count if the reroll saves
+                    saves, sixes = _count_d6_and_sixes(hits, state, defense_target)
+                    saves += count_d6_packed(sixes, state, defense_target) - sixes
+                else:
+                    saves = count_d6_packed(hits, state, defense_target)
+                out[trial] = hits - saves
+
+    def parallel_streams(n_trials: int) -> int:
+        """Number of streams simulate_attacks_parallel should be given for n_trials."""
+        return max(1, (n_trials + TRIALS_PER_STREAM - 1) // TRIALS_PER_STREAM)
+
+else:
+
+    roll_d6_packed = None
+    simulate_attacks_parallel = None
+    new_xoshiro_streams = None
+    parallel_streams = None
+    count_d6_packed = None
+    roll_d6_lanes = None
+    new_xoshiro_lanes = None
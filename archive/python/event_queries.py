@@ -0,0 +1,51 @@
+"""Index filters over the packed integer columns of a CombatEventLog.
+
+Compiled with Numba when it is installed; otherwise equivalent NumPy
+implementations are used.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def filter_by_value(values, target):
+        """Get the indices where values == target."""
+        out = np.empty(values.shape[0], dtype=np.int32)
+        count = 0
+        for i in range(values.shape[0]):
+            if values[i] == target:
+                out[count] = i
+                count += 1
+        return out[:count]
+
+    @njit(cache=True)
+    def filter_by_values(values, targets):
+        """Get the indices where values is any of targets."""
+        out = np.empty(values.shape[0], dtype=np.int32)
+        count = 0
+        for i in range(values.shape[0]):
+            value = values[i]
+            for j in range(targets.shape[0]):
+                if value == targets[j]:
+                    out[count] = i
+                    count += 1
+                    break
+        return out[:count]
+
+else:
+
+    def filter_by_value(values: NDArray, target: int) -> NDArray[np.int32]:
+        """Get the indices where values == target."""
+        return np.flatnonzero(values == target).astype(np.int32)
+
+    def filter_by_values(values: NDArray, targets: NDArray) -> NDArray[np.int32]:
+        """Get the indices where values is any of targets."""
+        return np.flatnonzero(np.isin(values, targets)).astype(np.int32)
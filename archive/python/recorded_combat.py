@@ -6,7 +6,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from src.engine.combat import CombatPhase, CombatResult, AttackResult
-from src.engine.combat_events import CombatEventLog, CombatEventRecorder
+from src.engine.combat_events import NULL_RECORDER, CombatEventLog, CombatEventRecorder
 from src.engine.combat_state import CombatStateManager, UnitCombatState, UnitStatus
 from src.engine.dice import DiceRoller, get_dice_roller
 from src.engine.morale import MoraleSystem, MoraleTestResult
@@ -27,22 +27,22 @@ from src.models.weapon import Weapon
 class RecordingDiceRoller(DiceRoller):
     """Dice roller that records all rolls for visualization."""
 
-    def __init__(self, recorder: CombatEventRecorder):
+    def __init__(self, recorder: CombatEventRecorder | None = None):
         super().__init__()
-        self._recorder = recorder
-        self._pending_hit_rolls: list[tuple[NDArray[np.int_], int, int]] = []
-        self._pending_defense_rolls: list[tuple[NDArray[np.int_], int, int, int]] = []
+        self._recorder = recorder or NULL_RECORDER
+        self._pending_hit_rolls: list[tuple[NDArray[np.uint8], int, int]] = []
+        self._pending_defense_rolls: list[tuple[NDArray[np.uint8], int, int, int]] = []
 
     def roll_quality_test(
         self,
         attacks: int,
         quality: int,
         modifier: int = 0,
-    ) -> tuple[int, NDArray[np.int_]]:
+    ) -> tuple[int, NDArray[np.uint8]]:
         """Roll quality test and record."""
         hits, rolls = super().roll_quality_test(attacks, quality, modifier)
         target = quality - modifier
-        self._recorder.record_hit_roll(rolls, target, hits, is_fatigued=False)
+        self._recorder.record_hit_roll_arr(rolls, target, hits, is_fatigued=False)
         return hits, rolls
 
     def roll_defense_test(
@@ -52,21 +52,21 @@ class RecordingDiceRoller(DiceRoller):
         ap: int = 0,
         modifier: int = 0,
         reroll_sixes: bool = False,
-    ) -> tuple[int, NDArray[np.int_]]:
+    ) -> tuple[int, NDArray[np.uint8]]:
         """Roll defense test and record."""
         wounds, rolls = super().roll_defense_test(hits, defense, ap, modifier, reroll_sixes)
         target = defense + ap - modifier
         saves = hits - wounds
-        self._recorder.record_defense_roll(rolls, defense, ap, saves, wounds, reroll_sixes)
+        self._recorder.record_defense_roll_arr(rolls, defense, ap, saves, wounds, reroll_sixes)
         return wounds, rolls
 
 
 class RecordingWoundAllocationManager(WoundAllocationManager):
     """Wound allocation manager that records events."""
 
-    def __init__(self, recorder: CombatEventRecorder):
+    def __init__(self, recorder: CombatEventRecorder | None = None):
         super().__init__()
-        self._recorder = recorder
+        self._recorder = recorder or NULL_RECORDER
 
     def allocate_wounds(
         self,
@@ -164,10 +164,10 @@ class RecordingWoundAllocationManager(WoundAllocationManager):
 class RecordedCombatResolver:
     """Combat resolver that records events for visualization."""
 
-    def __init__(self, recorder: CombatEventRecorder):
-        self._recorder = recorder
-        self.dice = RecordingDiceRoller(recorder)
-        self.wound_manager = RecordingWoundAllocationManager(recorder)
+    def __init__(self, recorder: CombatEventRecorder | None = None):
+        self._recorder = recorder or NULL_RECORDER
+        self.dice = RecordingDiceRoller(self._recorder)
+        self.wound_manager = RecordingWoundAllocationManager(self._recorder)
 
     def resolve_attack(
         self,
@@ -260,7 +260,7 @@ class RecordedCombatResolver:
         if attacker_fatigued:
             hit_rolls = self.dice.roll_d6(attacks)
             hits = self.dice.count_sixes(hit_rolls)
-            self._recorder.record_hit_roll(hit_rolls, 6, hits, is_fatigued=True)
+            self._recorder.record_hit_roll_arr(hit_rolls, 6, hits, is_fatigued=True)
             special_effects["fatigued"] = 1
         else:
             quality_mod = -1 if attacker_shaken else 0
@@ -348,7 +348,7 @@ class RecordedCombatResolver:
                 hit_rolls=hit_rolls,
                 hits=hits,
                 hits_after_modifiers=hits_after_mods,
-                defense_rolls=np.array([], dtype=np.int_),
+                defense_rolls=np.array([], dtype=np.uint8),
                 wounds_dealt=0,
                 special_effects=special_effects,
             )
@@ -425,9 +425,9 @@ class RecordedCombatResolver:
 class RecordedMoraleSystem(MoraleSystem):
     """Morale system that records events."""
 
-    def __init__(self, recorder: CombatEventRecorder):
+    def __init__(self, recorder: CombatEventRecorder | None = None):
         super().__init__()
-        self._recorder = recorder
+        self._recorder = recorder or NULL_RECORDER
 
     def check_casualty_morale(
         self,
@@ -494,8 +494,9 @@ class RecordedMoraleSystem(MoraleSystem):
 class RecordedMultiRoundCombat:
     """Multi-round combat that records all events for visualization."""
 
-    def __init__(self, max_rounds: int = 10):
+    def __init__(self, max_rounds: int = 10, record_events: bool = True):
         self.max_rounds = max_rounds
+        self.record_events = record_events
         self._recorder: CombatEventRecorder | None = None
         self._resolver: RecordedCombatResolver | None = None
         self._morale: RecordedMoraleSystem | None = None
@@ -512,7 +513,7 @@ class RecordedMultiRoundCombat:
             Tuple of (MultiRoundResult, CombatEventLog)
         """
         # Create recorder
-        self._recorder = CombatEventRecorder(attacker.name, defender.name)
+        self._recorder = CombatEventRecorder(attacker.name, defender.name, enabled=self.record_events)
         self._resolver = RecordedCombatResolver(self._recorder)
         self._morale = RecordedMoraleSystem(self._recorder)
 
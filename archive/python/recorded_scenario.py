@@ -31,7 +31,8 @@ class RecordedScenarioResult:
 class RecordedScenarioRunner:
     """Runs combat scenarios with full event recording for visualization."""
 
-    def __init__(self):
+    def __init__(self, record_events: bool = True):
+        self.record_events = record_events
         self._recorder: CombatEventRecorder | None = None
         self._resolver: RecordedCombatResolver | None = None
         self._morale: RecordedMoraleSystem | None = None
@@ -63,7 +64,9 @@ class RecordedScenarioRunner:
         defender_state = UnitCombatState(unit=defender_copy)
 
         # Create recorder and systems
-        self._recorder = CombatEventRecorder(attacker_copy.name, defender_copy.name)
+        self._recorder = CombatEventRecorder(
+            attacker_copy.name, defender_copy.name, enabled=self.record_events
+        )
         self._resolver = RecordedCombatResolver(self._recorder)
         self._morale = RecordedMoraleSystem(self._recorder)
 
@@ -1,7 +1,16 @@
 """Combat scenarios for simulation."""
 
+import multiprocessing as mp
+import os
+import pickle
+import struct
+import threading
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from multiprocessing import shared_memory, util
+
+import numpy as np
 
 from src.engine.combat import CombatPhase, CombatResolver, CombatResult
 from src.engine.combat_state import UnitCombatState, UnitStatus
@@ -32,6 +41,48 @@ class ScenarioType(str, Enum):
     FIGHTING_RETREAT = "fighting_retreat"  # Attacker shoots, retreats, repeats for up to 5 rounds
 
 
+# Preallocated phase rows per scenario; the longest scenario (fighting retreat)
+# records at most 4 phases per round over 5 rounds.
+MAX_PHASES = 20
+
+# Compact per-phase record stored in ScenarioResult instead of Python objects
+PHASE_DTYPE = np.dtype([
+    ("phase_id", np.uint16),
+    ("wounds", np.uint16),
+    ("atk_alive", np.uint16),
+    ("def_alive", np.uint16),
+    ("morale_id", np.uint8),
+    ("atk_status", np.uint8),
+    ("def_status", np.uint8),
+])
+
+# Integer codes for the phase record columns
+_STATUS_BY_CODE: tuple[UnitStatus, ...] = tuple(UnitStatus)
+_STATUS_CODES: dict[UnitStatus, int] = {status: i for i, status in enumerate(_STATUS_BY_CODE)}
+# Morale code 0 means no morale test was taken
+_MORALE_CODES: dict[MoraleOutcome, int] = {outcome: i + 1 for i, outcome in enumerate(MoraleOutcome)}
+
+# Compact combat snapshot: (wounds allocated, models killed)
+_COMBAT_SUMMARY = struct.Struct("<HH")
+
+
+# Per-scenario summary row written by batch workers into shared memory
+RESULT_DTYPE = np.dtype([
+    ("atk_models_end", np.uint16),
+    ("def_models_end", np.uint16),
+    ("atk_status", np.uint8),
+    ("def_status", np.uint8),
+    ("outcome", np.uint8),  # 0 = draw, 1 = attacker won, 2 = defender won
+    ("wounds_by_atk", np.uint16),
+    ("wounds_by_def", np.uint16),
+    ("kills_by_atk", np.uint16),
+    ("kills_by_def", np.uint16),
+])
+
+# A batch job: (scenario_type, attacker_index, defender_index, defender_in_cover)
+BatchJob = tuple[ScenarioType, int, int, bool]
+
+
 @dataclass
 class ScenarioPhaseResult:
     """Result of a single phase within a scenario."""
@@ -43,6 +94,22 @@ class ScenarioPhaseResult:
     morale_result: MoraleTestResult | None = None
     attacker_status: UnitStatus = UnitStatus.NORMAL
     defender_status: UnitStatus = UnitStatus.NORMAL
+    _packed_summary: bytes | None = field(default=None, repr=False)
+
+    def combat_summary(self) -> tuple[int, int] | None:
+        """Get (wounds allocated, models killed) for this phase.
+
+        Works for both full and compact results; returns None for phases
+        without a combat (e.g. melee morale).
+        """
+        if self.combat_result is not None:
+            return (
+                self.combat_result.wound_allocation.wounds_allocated,
+                self.combat_result.defender_models_killed,
+            )
+        if self._packed_summary is not None:
+            return _COMBAT_SUMMARY.unpack(self._packed_summary)
+        return None
 
 
 @dataclass
@@ -52,7 +119,25 @@ class ScenarioResult:
     scenario_type: ScenarioType
     attacker_name: str
     defender_name: str
-    phases: list[ScenarioPhaseResult] = field(default_factory=list)
+
+    # Phase records - one PHASE_DTYPE row per phase. The row buffer is
+    # allocated on the first recorded phase.
+    _phases_buf: np.ndarray | None = field(default=None, init=False, repr=False)
+    _phase_count: int = field(default=0, init=False, repr=False)
+    # Distinct phase names of this result; a row's phase_id indexes it
+    _phase_names: list[str] = field(default_factory=list, init=False, repr=False)
+    # Rich objects needed to materialize ScenarioPhaseResult, one per phase.
+    # Left empty for compact results, which keep only the rows and snapshots.
+    _phase_combats: list[CombatResult | None] = field(default_factory=list, init=False, repr=False)
+    _phase_morales: list[MoraleTestResult | None] = field(default_factory=list, init=False, repr=False)
+    # Packed combat snapshots, one per phase, used instead of CombatResult
+    # objects when the runner records compact results
+    _compact_buf: bytearray | None = field(default=None, init=False, repr=False)
+    _phase_has_combat: list[bool] = field(default_factory=list, init=False, repr=False)
+    # phases materialized on first access, dropped when a phase is added
+    _phases_cache: tuple[ScenarioPhaseResult, ...] | None = field(
+        default=None, init=False, repr=False
+    )
 
     # Final state
     attacker_models_start: int = 0
@@ -79,6 +164,56 @@ class ScenarioResult:
     attacker_routed: bool = False
     defender_routed: bool = False
 
+    @property
+    def phase_records(self) -> np.ndarray:
+        """Get the recorded phases as a PHASE_DTYPE structured array."""
+        if self._phases_buf is None:
+            return np.empty(0, dtype=PHASE_DTYPE)
+        return self._phases_buf[: self._phase_count]
+
+    @property
+    def phases(self) -> tuple[ScenarioPhaseResult, ...]:
+        """Get the recorded phases as ScenarioPhaseResult objects.
+
+        Read-only: the tuple is built from the phase records on first access
+        and reused until another phase is added. For compact results,
+        combat_result and morale_result are None; use combat_summary() and
+        the morale_id column of phase_records instead.
+        """
+        if self._phases_cache is None:
+            self._phases_cache = tuple(self._materialize_phases())
+        return self._phases_cache
+
+    def _materialize_phases(self):
+        """Yield one ScenarioPhaseResult per phase record."""
+        compact = self._compact_buf
+        size = _COMBAT_SUMMARY.size
+        names = self._phase_names
+        for i, row in enumerate(self.phase_records):
+            yield ScenarioPhaseResult(
+                phase_name=names[row["phase_id"]],
+                combat_result=None if compact is not None else self._phase_combats[i],
+                attacker_models_after=int(row["atk_alive"]),
+                defender_models_after=int(row["def_alive"]),
+                morale_result=None if compact is not None else self._phase_morales[i],
+                attacker_status=_STATUS_BY_CODE[row["atk_status"]],
+                defender_status=_STATUS_BY_CODE[row["def_status"]],
+                _packed_summary=(
+                    bytes(compact[i * size:(i + 1) * size])
+                    if compact is not None and self._phase_has_combat[i]
+                    else None
+                ),
+            )
+
+    def _phase_id(self, phase_name: str) -> int:
+        """Get the id of a phase name in this result's table, adding it on first use."""
+        names = self._phase_names
+        try:
+            return names.index(phase_name)
+        except ValueError:
+            names.append(phase_name)
+            return len(names) - 1
+
     def compute_outcome(self) -> None:
         """Compute the outcome based on final model counts and status."""
         # Check for rout (removed from play)
@@ -111,16 +246,28 @@ class ScenarioRunner:
     copies for each iteration, reducing memory allocation overhead.
     """
 
-    def __init__(self, combat_resolver: CombatResolver | None = None):
+    def __init__(
+        self,
+        combat_resolver: CombatResolver | None = None,
+        compact_results: bool = False,
+        morale_system: MoraleSystem | None = None,
+    ):
         """Initialize scenario runner.
 
         Args:
             combat_resolver: Optional combat resolver to use
+            compact_results: If True, phases keep only their PHASE_DTYPE rows
+                and packed (wounds, kills) snapshots instead of full
+                CombatResult and MoraleTestResult objects
+            morale_system: Optional morale system to use
         """
         self.resolver = combat_resolver or CombatResolver()
-        self.morale_system = MoraleSystem()
+        self._compact_results = compact_results
+        self.morale_system = morale_system or MoraleSystem()
         # Working copies cache - keyed by (attacker_id, defender_id)
         self._working_copies: dict[tuple[int, int], tuple[Unit, Unit]] = {}
+        # Free list of combat state trackers reused across scenarios
+        self._state_pool: list[UnitCombatState] = []
 
     def _get_working_copies(self, attacker: Unit, defender: Unit) -> tuple[Unit, Unit]:
         """Get or create working copies of units for simulation.
@@ -150,9 +297,30 @@ class ScenarioRunner:
 
         return atk_copy, def_copy
 
+    def _get_state(self, unit: Unit) -> UnitCombatState:
+        """Get a combat state tracker for a unit, reusing a pooled one if available.
+
+        Args:
+            unit: The working copy the state should track
+
+        Returns:
+            A reset UnitCombatState bound to the unit
+        """
+        if self._state_pool:
+            state = self._state_pool.pop()
+            state.unit = unit
+            state.reset()
+            return state
+        return UnitCombatState(unit=unit)
+
+    def _release_state(self, state: UnitCombatState) -> None:
+        """Return a combat state tracker to the pool for later reuse."""
+        self._state_pool.append(state)
+
     def clear_working_copies(self) -> None:
-        """Clear cached working copies to free memory."""
+        """Clear cached working copies and pooled states to free memory."""
         self._working_copies.clear()
+        self._state_pool.clear()
 
     def run_scenario(
         self,
@@ -175,9 +343,9 @@ class ScenarioRunner:
         # Get working copies (reuses cached copies when possible)
         attacker_copy, defender_copy = self._get_working_copies(attacker, defender)
 
-        # Create combat state trackers for morale
-        attacker_state = UnitCombatState(unit=attacker_copy)
-        defender_state = UnitCombatState(unit=defender_copy)
+        # Get combat state trackers for morale (reuses pooled states when possible)
+        attacker_state = self._get_state(attacker_copy)
+        defender_state = self._get_state(defender_copy)
 
         result = ScenarioResult(
             scenario_type=scenario_type,
@@ -186,27 +354,14 @@ class ScenarioRunner:
             attacker_models_start=attacker_copy.model_count,
             defender_models_start=defender_copy.model_count,
         )
+        if self._compact_results:
+            result._compact_buf = bytearray()
 
-        # Run the appropriate scenario
-        match scenario_type:
-            case ScenarioType.SHOOTING_ONLY:
-                self._run_shooting_only(attacker_state, defender_state, defender_in_cover, result)
-            case ScenarioType.MUTUAL_SHOOTING:
-                self._run_mutual_shooting(attacker_state, defender_state, defender_in_cover, result)
-            case ScenarioType.CHARGE:
-                self._run_charge(attacker_state, defender_state, result)
-            case ScenarioType.RECEIVE_CHARGE:
-                self._run_receive_charge(attacker_state, defender_state, result)
-            case ScenarioType.SHOOT_THEN_CHARGE:
-                self._run_shoot_then_charge(attacker_state, defender_state, defender_in_cover, result)
-            case ScenarioType.APPROACH_1_TURN:
-                self._run_approach(attacker_state, defender_state, 1, result)
-            case ScenarioType.APPROACH_2_TURNS:
-                self._run_approach(attacker_state, defender_state, 2, result)
-            case ScenarioType.FULL_ENGAGEMENT:
-                self._run_full_engagement(attacker_state, defender_state, defender_in_cover, result)
-            case ScenarioType.FIGHTING_RETREAT:
-                self._run_fighting_retreat(attacker_state, defender_state, result)
+        # Run the appropriate scenario (plain string values are coerced to the enum)
+        handler = self._SCENARIO_HANDLERS.get(scenario_type)
+        if handler is None:
+            handler = self._SCENARIO_HANDLERS[ScenarioType(scenario_type)]
+        handler(self, attacker_state, defender_state, defender_in_cover, result)
 
         # Record final state
         result.attacker_models_end = attacker_copy.alive_count
@@ -217,6 +372,9 @@ class ScenarioRunner:
         result.defender_routed = defender_state.status == UnitStatus.ROUTED
         result.compute_outcome()
 
+        self._release_state(attacker_state)
+        self._release_state(defender_state)
+
         return result
 
     def _add_phase(
@@ -229,17 +387,35 @@ class ScenarioRunner:
         morale_result: MoraleTestResult | None = None,
     ) -> None:
         """Add a phase result to the scenario."""
-        result.phases.append(
-            ScenarioPhaseResult(
-                phase_name=phase_name,
-                combat_result=combat_result,
-                attacker_models_after=attacker_state.unit.alive_count,
-                defender_models_after=defender_state.unit.alive_count,
-                morale_result=morale_result,
-                attacker_status=attacker_state.status,
-                defender_status=defender_state.status,
-            )
-        )
+        index = result._phase_count
+        buf = result._phases_buf
+        if buf is None:
+            buf = result._phases_buf = np.zeros(MAX_PHASES, dtype=PHASE_DTYPE)
+        elif index == len(buf):
+            buf = result._phases_buf = np.resize(buf, index * 2)
+
+        row = buf[index]
+        row["phase_id"] = result._phase_id(phase_name)
+        row["wounds"] = combat_result.wound_allocation.wounds_allocated if combat_result else 0
+        row["atk_alive"] = attacker_state.unit.alive_count
+        row["def_alive"] = defender_state.unit.alive_count
+        row["morale_id"] = _MORALE_CODES[morale_result.outcome] if morale_result else 0
+        row["atk_status"] = _STATUS_CODES[attacker_state.status]
+        row["def_status"] = _STATUS_CODES[defender_state.status]
+        result._phase_count = index + 1
+        result._phases_cache = None
+        result._phase_has_combat.append(combat_result is not None)
+        if result._compact_buf is not None:
+            if combat_result is not None:
+                result._compact_buf.extend(_COMBAT_SUMMARY.pack(
+                    combat_result.wound_allocation.wounds_allocated,
+                    combat_result.defender_models_killed,
+                ))
+            else:
+                result._compact_buf.extend(_COMBAT_SUMMARY.pack(0, 0))
+        else:
+            result._phase_combats.append(combat_result)
+            result._phase_morales.append(morale_result)
 
         if combat_result:
             # Track damage dealt based on who is attacking
@@ -274,6 +450,32 @@ class ScenarioRunner:
         morale_result = self.morale_system.check_melee_morale(loser_state, wounds_dealt, wounds_taken)
         return morale_result
 
+    def _resolve_melee_morale(
+        self,
+        attacker_state: UnitCombatState,
+        defender_state: UnitCombatState,
+        attacker_wounds_dealt: int,
+        defender_wounds_dealt: int,
+        result: ScenarioResult,
+        phase_prefix: str = "",
+    ) -> None:
+        """Have the melee loser (dealt fewer wounds) take a morale test.
+
+        Nothing happens on a tie, including when neither side scored.
+        """
+        if attacker_wounds_dealt == defender_wounds_dealt:
+            return
+
+        if attacker_wounds_dealt < defender_wounds_dealt:
+            morale_result = self._check_melee_morale(attacker_state, attacker_wounds_dealt, defender_wounds_dealt)
+            phase_name = f"{phase_prefix}Attacker Melee Morale"
+        else:
+            morale_result = self._check_melee_morale(defender_state, defender_wounds_dealt, attacker_wounds_dealt)
+            phase_name = f"{phase_prefix}Defender Melee Morale"
+
+        if morale_result:
+            self._add_phase(result, phase_name, None, attacker_state, defender_state, morale_result)
+
     def _is_out_of_action(self, state: UnitCombatState) -> bool:
         """Check if unit is destroyed or routed."""
         return state.unit.alive_count == 0 or state.status == UnitStatus.ROUTED
@@ -382,14 +584,9 @@ class ScenarioRunner:
             self._add_phase(result, "Defender Strike Back", defender_combat, attacker_state, defender_state)
 
         # Check melee morale - loser (dealt fewer wounds) takes test
-        if attacker_wounds_dealt < defender_wounds_dealt:
-            morale_result = self._check_melee_morale(attacker_state, attacker_wounds_dealt, defender_wounds_dealt)
-            if morale_result:
-                self._add_phase(result, "Attacker Melee Morale", None, attacker_state, defender_state, morale_result)
-        elif defender_wounds_dealt < attacker_wounds_dealt:
-            morale_result = self._check_melee_morale(defender_state, defender_wounds_dealt, attacker_wounds_dealt)
-            if morale_result:
-                self._add_phase(result, "Defender Melee Morale", None, attacker_state, defender_state, morale_result)
+        self._resolve_melee_morale(
+            attacker_state, defender_state, attacker_wounds_dealt, defender_wounds_dealt, result
+        )
 
     def _run_receive_charge(
         self,
@@ -427,15 +624,10 @@ class ScenarioRunner:
 
             self._add_phase(result, "Attacker Strike Back", attacker_combat, attacker_state, defender_state)
 
-        # Check melee morale
-        if attacker_wounds_dealt < defender_wounds_dealt:
-            morale_result = self._check_melee_morale(attacker_state, attacker_wounds_dealt, defender_wounds_dealt)
-            if morale_result:
-                self._add_phase(result, "Attacker Melee Morale", None, attacker_state, defender_state, morale_result)
-        elif defender_wounds_dealt < attacker_wounds_dealt:
-            morale_result = self._check_melee_morale(defender_state, defender_wounds_dealt, attacker_wounds_dealt)
-            if morale_result:
-                self._add_phase(result, "Defender Melee Morale", None, attacker_state, defender_state, morale_result)
+        # Check melee morale - loser (dealt fewer wounds) takes test
+        self._resolve_melee_morale(
+            attacker_state, defender_state, attacker_wounds_dealt, defender_wounds_dealt, result
+        )
 
     def _run_shoot_then_charge(
         self,
@@ -495,15 +687,10 @@ class ScenarioRunner:
 
                 self._add_phase(result, "Attacker Strike Back", attacker_melee, attacker_state, defender_state)
 
-            # Check melee morale
-            if attacker_wounds_dealt < defender_wounds_dealt:
-                morale_result = self._check_melee_morale(attacker_state, attacker_wounds_dealt, defender_wounds_dealt)
-                if morale_result:
-                    self._add_phase(result, "Attacker Melee Morale", None, attacker_state, defender_state, morale_result)
-            elif defender_wounds_dealt < attacker_wounds_dealt:
-                morale_result = self._check_melee_morale(defender_state, defender_wounds_dealt, attacker_wounds_dealt)
-                if morale_result:
-                    self._add_phase(result, "Defender Melee Morale", None, attacker_state, defender_state, morale_result)
+            # Check melee morale - loser (dealt fewer wounds) takes test
+            self._resolve_melee_morale(
+                attacker_state, defender_state, attacker_wounds_dealt, defender_wounds_dealt, result
+            )
 
     def _run_approach(
         self,
@@ -633,22 +820,192 @@ class ScenarioRunner:
                 self._add_phase(result, f"{phase_prefix}Attacker Strike Back", attacker_melee,
                                attacker_state, defender_state)
 
-            # Check melee morale
-            if attacker_wounds_dealt < defender_wounds_dealt:
-                morale_result = self._check_melee_morale(attacker_state, attacker_wounds_dealt, defender_wounds_dealt)
-                if morale_result:
-                    self._add_phase(result, f"{phase_prefix}Attacker Melee Morale", None,
-                                   attacker_state, defender_state, morale_result)
-            elif defender_wounds_dealt < attacker_wounds_dealt:
-                morale_result = self._check_melee_morale(defender_state, defender_wounds_dealt, attacker_wounds_dealt)
-                if morale_result:
-                    self._add_phase(result, f"{phase_prefix}Defender Melee Morale", None,
-                                   attacker_state, defender_state, morale_result)
+            # Check melee morale - loser (dealt fewer wounds) takes test
+            self._resolve_melee_morale(
+                attacker_state, defender_state, attacker_wounds_dealt, defender_wounds_dealt, result, phase_prefix
+            )
 
             # Reset round state for next iteration (fatigue, etc.)
             attacker_state.reset_round_state()
             defender_state.reset_round_state()
 
+    # Scenario dispatch table, built once per class instead of matching per
+    # call. Each handler takes (runner, attacker_state, defender_state,
+    # defender_in_cover, result).
+    _SCENARIO_HANDLERS: dict[
+        ScenarioType,
+        Callable[["ScenarioRunner", UnitCombatState, UnitCombatState, bool, ScenarioResult], None],
+    ] = {
+        ScenarioType.SHOOTING_ONLY: _run_shooting_only,
+        ScenarioType.MUTUAL_SHOOTING: _run_mutual_shooting,
+        ScenarioType.CHARGE: lambda self, atk, dfn, cover, res: self._run_charge(atk, dfn, res),
+        ScenarioType.RECEIVE_CHARGE: lambda self, atk, dfn, cover, res: self._run_receive_charge(atk, dfn, res),
+        ScenarioType.SHOOT_THEN_CHARGE: _run_shoot_then_charge,
+        ScenarioType.APPROACH_1_TURN: lambda self, atk, dfn, cover, res: self._run_approach(atk, dfn, 1, res),
+        ScenarioType.APPROACH_2_TURNS: lambda self, atk, dfn, cover, res: self._run_approach(atk, dfn, 2, res),
+        ScenarioType.FULL_ENGAGEMENT: _run_full_engagement,
+        ScenarioType.FIGHTING_RETREAT: lambda self, atk, dfn, cover, res: self._run_fighting_retreat(atk, dfn, res),
+    }
+
+
+class BatchScenarioResults:
+    """Results of a parallel batch run, stored as a RESULT_DTYPE array.
+
+    ScenarioResult objects (without phase records) are only built when
+    an individual result is accessed.
+    """
+
+    def __init__(self, records: np.ndarray, jobs: Sequence[BatchJob], units: Sequence[Unit]):
+        self.records = records
+        self._jobs = jobs
+        self._units = units
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: int) -> ScenarioResult:
+        """Materialize the ScenarioResult for one job."""
+        scenario_type, attacker_index, defender_index, _ = self._jobs[index]
+        attacker = self._units[attacker_index]
+        defender = self._units[defender_index]
+        row = self.records[index]
+        outcome = int(row["outcome"])
+        attacker_status = _STATUS_BY_CODE[row["atk_status"]]
+        defender_status = _STATUS_BY_CODE[row["def_status"]]
+
+        return ScenarioResult(
+            scenario_type=scenario_type,
+            attacker_name=attacker.name,
+            defender_name=defender.name,
+            attacker_models_start=attacker.model_count,
+            attacker_models_end=int(row["atk_models_end"]),
+            defender_models_start=defender.model_count,
+            defender_models_end=int(row["def_models_end"]),
+            attacker_final_status=attacker_status,
+            defender_final_status=defender_status,
+            attacker_won=outcome == 1,
+            defender_won=outcome == 2,
+            draw=outcome == 0,
+            total_wounds_dealt_by_attacker=int(row["wounds_by_atk"]),
+            total_wounds_dealt_by_defender=int(row["wounds_by_def"]),
+            total_models_killed_by_attacker=int(row["kills_by_atk"]),
+            total_models_killed_by_defender=int(row["kills_by_def"]),
+            attacker_routed=attacker_status == UnitStatus.ROUTED,
+            defender_routed=defender_status == UnitStatus.ROUTED,
+        )
+
+
+# Per-process state for batch workers, set up once by _init_batch_worker
+_WORKER_RUNNER: ScenarioRunner | None = None
+_WORKER_UNITS: list[Unit] = []
+_WORKER_SHM: shared_memory.SharedMemory | None = None
+_WORKER_RECORDS: np.ndarray | None = None
+
+
+def _init_batch_worker(units_blob: bytes, shm_name: str, job_count: int) -> None:
+    """Unpickle unit templates and attach to the shared result array."""
+    global _WORKER_RUNNER, _WORKER_UNITS, _WORKER_SHM, _WORKER_RECORDS
+    _WORKER_UNITS = pickle.loads(units_blob)
+    _WORKER_RUNNER = ScenarioRunner(compact_results=True)
+    _WORKER_SHM = shared_memory.SharedMemory(name=shm_name)
+    _WORKER_RECORDS = np.ndarray((job_count,), dtype=RESULT_DTYPE, buffer=_WORKER_SHM.buf)
+    # Detach when the worker exits; run_batch_parallel closes and joins the
+    # pool so workers exit normally instead of being terminated
+    util.Finalize(None, _close_batch_worker, exitpriority=10)
+
+
+def _close_batch_worker() -> None:
+    """Release the worker's view of the shared result array and detach from it."""
+    global _WORKER_SHM, _WORKER_RECORDS
+    # The array borrows the segment's buffer, so it must go before close()
+    _WORKER_RECORDS = None
+    if _WORKER_SHM is not None:
+        _WORKER_SHM.close()
+        _WORKER_SHM = None
+
+
+def _run_batch_chunk(start: int, jobs: Sequence[BatchJob]) -> None:
+    """Run a contiguous slice of batch jobs, writing rows from index start."""
+    runner = _WORKER_RUNNER
+    units = _WORKER_UNITS
+    records = _WORKER_RECORDS
+
+    for offset, (scenario_type, attacker_index, defender_index, in_cover) in enumerate(jobs):
+        result = runner.run_scenario(scenario_type, units[attacker_index], units[defender_index], in_cover)
+        row = records[start + offset]
+        row["atk_models_end"] = result.attacker_models_end
+        row["def_models_end"] = result.defender_models_end
+        row["atk_status"] = _STATUS_CODES[result.attacker_final_status]
+        row["def_status"] = _STATUS_CODES[result.defender_final_status]
+        row["outcome"] = 1 if result.attacker_won else 2 if result.defender_won else 0
+        row["wounds_by_atk"] = result.total_wounds_dealt_by_attacker
+        row["wounds_by_def"] = result.total_wounds_dealt_by_defender
+        row["kills_by_atk"] = result.total_models_killed_by_attacker
+        row["kills_by_def"] = result.total_models_killed_by_defender
+
+
+def run_batch_parallel(
+    units: Sequence[Unit],
+    jobs: Sequence[BatchJob],
+    n_workers: int | None = None,
+) -> BatchScenarioResults:
+    """Run many scenarios across worker processes.
+
+    Unit templates are pickled once and handed to each worker at startup;
+    each worker keeps its own ScenarioRunner (and its working-copy and state
+    pools) and writes summary rows straight into a shared-memory array.
+
+    Args:
+        units: Unit templates referenced by index from the jobs
+        jobs: (scenario_type, attacker_index, defender_index, defender_in_cover) tuples
+        n_workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        BatchScenarioResults with one RESULT_DTYPE row per job
+    """
+    job_count = len(jobs)
+    if job_count == 0:
+        return BatchScenarioResults(np.zeros(0, dtype=RESULT_DTYPE), jobs, units)
+
+    n_workers = n_workers or os.cpu_count() or 1
+    chunk_size = max(1, -(-job_count // (n_workers * 4)))
+    chunks = [(start, jobs[start:start + chunk_size]) for start in range(0, job_count, chunk_size)]
+
+    shm = shared_memory.SharedMemory(create=True, size=job_count * RESULT_DTYPE.itemsize)
+    try:
+        with mp.Pool(
+            n_workers,
+            initializer=_init_batch_worker,
+            initargs=(pickle.dumps(list(units)), shm.name, job_count),
+        ) as pool:
+            pool.starmap(_run_batch_chunk, chunks)
+            # Let workers exit (and run their finalizers) before the with
+            # block terminates the pool
+            pool.close()
+            pool.join()
+
+        records = np.ndarray((job_count,), dtype=RESULT_DTYPE, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return BatchScenarioResults(records, jobs, units)
+
+
+# Per-thread scenario runner for run_scenario(), with its resolver and
+# morale system. The runner's working copies and pooled states are cleared
+# after every call, so it never keeps the units it was given alive.
+_thread_runners = threading.local()
+
+
+def _get_thread_runner() -> ScenarioRunner:
+    """Get this thread's shared scenario runner, creating it on first use."""
+    pid = os.getpid()
+    if getattr(_thread_runners, "pid", None) != pid:
+        _thread_runners.runner = ScenarioRunner()
+        _thread_runners.pid = pid
+    return _thread_runners.runner
+
 
 def run_scenario(
     scenario_type: ScenarioType,
@@ -657,5 +1014,8 @@ def run_scenario(
     defender_in_cover: bool = False,
 ) -> ScenarioResult:
     """Convenience function to run a scenario."""
-    runner = ScenarioRunner()
-    return runner.run_scenario(scenario_type, attacker, defender, defender_in_cover)
+    runner = _get_thread_runner()
+    try:
+        return runner.run_scenario(scenario_type, attacker, defender, defender_in_cover)
+    finally:
+        runner.clear_working_copies()
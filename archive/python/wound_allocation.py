@@ -229,13 +229,13 @@ class WoundAllocationManager:
 
         # Protected saves first (typically 6+)
         if has_protected and remaining > 0:
-            successes, _ = dice.roll_d6_target(remaining, protected_target)
+            successes = dice.roll_d6_successes(remaining, protected_target)
             total_saves += successes
             remaining -= successes
 
         # Regeneration saves (typically 5+)
         if has_regen and remaining > 0:
-            successes, _ = dice.roll_d6_target(remaining, regen_target)
+            successes = dice.roll_d6_successes(remaining, regen_target)
             total_saves += successes
             remaining -= successes
 
@@ -24,17 +24,20 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import heapq
 import json
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 try:
-    import pandas as pd
+    from openpyxl import load_workbook
 except ImportError:
-    print("Error: pandas is required. Install with: pip install pandas openpyxl")
+    print("Error: openpyxl is required. Install with: pip install openpyxl")
     exit(1)
 
 
@@ -66,6 +69,19 @@ TRUNCATED_RULES = {
     "MORALE_DEBU": "MORALE_DEBUFF",
 }
 
+# Matches a rule name starting with any TRUNCATED_RULES key (none of the
+# keys is a prefix of another, so at most one can match)
+TRUNCATED_RULE_RE = re.compile("|".join(map(re.escape, TRUNCATED_RULES)))
+
+# Numeric rule parameters, replaced by (X) for template matching
+PAREN_NUM_RE = re.compile(r'\(\d+\)')
+
+# Trailing (X) parameter placeholder of a normalized rule name
+PAREN_X_SUFFIX_RE = re.compile(r'\(X\)$')
+
+# Spaces and hyphens both become underscores in normalized rule names
+RULE_NAME_TRANSLATION = str.maketrans(" -", "__")
+
 # Super-categories for aggressive grouping mode
 # These group multiple buckets that have similar mechanical effects
 SUPER_CATEGORY_MAP = {
@@ -141,21 +157,32 @@ class SpecialRulesBucketMapper:
         self.rule_to_bucket: Dict[str, str] = {}
         self.bucket_to_rules: Dict[str, List[str]] = defaultdict(list)
         self.aggressive = aggressive
+        # Bucket for each rule string seen so far (None for misparsed
+        # weapon strings), so repeated rules are classified only once
+        self._rule_bucket_memo: Dict[str, Optional[str]] = {}
+        # Mapped result for each rules tuple seen so far; loadouts of one
+        # unit and copies of one weapon share the same tuples
+        self._rules_buckets_memo: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        # Weapon effective key for each (name, range, attacks, ap, special)
+        # seen so far, since copies of a weapon profile recur across loadouts
+        self._weapon_key_memo: Dict[tuple, str] = {}
         self._load_buckets(buckets_file)
 
-    def _normalize_rule_name(self, rule: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _normalize_rule_name(rule: str) -> str:
         """Normalize rule name for matching."""
         # Remove parenthetical values: "Tough(6)" -> "Tough"
         # But keep (X) pattern intact for template matching
         rule = rule.strip()
         # Replace (number) with (X) for matching
-        normalized = re.sub(r'\(\d+\)', '(X)', rule)
-        normalized = normalized.upper().replace(' ', '_').replace('-', '_')
+        normalized = PAREN_NUM_RE.sub('(X)', rule)
+        normalized = normalized.upper().translate(RULE_NAME_TRANSLATION)
 
         # Handle truncated rule names
-        for truncated, full in TRUNCATED_RULES.items():
-            if normalized == truncated or normalized.startswith(truncated):
-                return full
+        m = TRUNCATED_RULE_RE.match(normalized)
+        if m:
+            return TRUNCATED_RULES[m.group()]
 
         return normalized
 
@@ -165,17 +192,29 @@ class SpecialRulesBucketMapper:
             print(f"Warning: Buckets file not found: {buckets_file}")
             return
 
+        # Stream the two columns we need straight from the sheet
         try:
-            df = pd.read_excel(buckets_file, sheet_name='Rules_With_Buckets')
+            wb = load_workbook(buckets_file, read_only=True, data_only=True)
+            try:
+                rows = wb['Rules_With_Buckets'].iter_rows(values_only=True)
+                header = next(rows, ())
+                if 'Rule Name' in header and 'Mechanical_Bucket' in header:
+                    name_col = header.index('Rule Name')
+                    bucket_col = header.index('Mechanical_Bucket')
+                    min_len = max(name_col, bucket_col) + 1
+                    pairs = [(row[name_col], row[bucket_col])
+                             for row in rows if len(row) >= min_len]
+                else:
+                    pairs = []
+            finally:
+                wb.close()
         except Exception as e:
             print(f"Warning: Could not read buckets file: {e}")
             return
 
-        for _, row in df.iterrows():
-            rule_name = row.get('Rule Name', '')
-            bucket = row.get('Mechanical_Bucket', '')
-
-            if pd.isna(rule_name) or pd.isna(bucket):
+        rule_to_bucket: Dict[str, str] = {}
+        for rule_name, bucket in pairs:
+            if rule_name is None or bucket is None:
                 continue
 
             rule_name = str(rule_name).strip()
@@ -184,13 +223,15 @@ class SpecialRulesBucketMapper:
             if rule_name and bucket:
                 # Store both the normalized and original versions
                 normalized = self._normalize_rule_name(rule_name)
-                self.rule_to_bucket[normalized] = bucket
+                rule_to_bucket[normalized] = bucket
                 self.bucket_to_rules[bucket].append(rule_name)
 
                 # Also store without (X) for rules that don't have parameters
                 base_name = normalized.replace('(X)', '').strip('_')
                 if base_name != normalized:
-                    self.rule_to_bucket[base_name] = bucket
+                    rule_to_bucket[base_name] = bucket
+
+        self.rule_to_bucket.update(rule_to_bucket)
 
         print(f"Loaded {len(self.rule_to_bucket)} rule->bucket mappings")
         print(f"Total unique buckets: {len(self.bucket_to_rules)}")
@@ -216,7 +257,7 @@ class SpecialRulesBucketMapper:
             bucket = self.rule_to_bucket[normalized]
         else:
             # Try without the (X) parameter
-            base_name = re.sub(r'\(X\)$', '', normalized).strip('_')
+            base_name = PAREN_X_SUFFIX_RE.sub('', normalized).strip('_')
             if base_name in self.rule_to_bucket:
                 bucket = self.rule_to_bucket[base_name]
             else:
@@ -243,14 +284,24 @@ class SpecialRulesBucketMapper:
 
     def normalize_rules_to_buckets(self, rules: Tuple[str, ...]) -> Tuple[str, ...]:
         """Map a list of rules to their bucket equivalents."""
+        result = self._rules_buckets_memo.get(rules)
+        if result is not None:
+            return result
+
+        memo = self._rule_bucket_memo
         buckets = set()
         for rule in rules:
-            # Skip weapon strings that got misparsed as rules
-            if self.is_weapon_string(rule):
-                continue
-            bucket = self.get_bucket(rule)
-            buckets.add(bucket)
-        return tuple(sorted(buckets))
+            if rule in memo:
+                bucket = memo[rule]
+            elif self.is_weapon_string(rule):
+                # Skip weapon strings that got misparsed as rules
+                bucket = memo[rule] = None
+            else:
+                bucket = memo[rule] = self.get_bucket(rule)
+            if bucket is not None:
+                buckets.add(bucket)
+        result = self._rules_buckets_memo[rules] = tuple(sorted(buckets))
+        return result
 
 
 # Rules to completely ignore (don't affect combat simulation significantly)
@@ -263,7 +314,34 @@ IGNORABLE_RULES = {
 }
 
 
-@dataclass
+def _format_weapon_key(name: str, range_inches: Optional[int], attacks: int,
+                       ap: Optional[int], specials: Tuple[str, ...]) -> str:
+    """Effective key for a weapon's combat characteristics; see Weapon.effective_key."""
+    # Use exact range, not bucketed
+    if range_inches is None or range_inches == 0:
+        rng_str = "Melee"
+    else:
+        rng_str = f"{range_inches}\""
+
+    ap_str = str(ap) if ap is not None else "-"
+
+    specials_str = ";".join(specials)
+    # Include weapon name to prevent cross-weapon bucketing
+    return f"N={name}|R={rng_str}|A={attacks}|AP={ap_str}|S={specials_str}"
+
+
+# Copies of a weapon profile recur across loadouts, so their unmapped keys
+# are cached on the fields that go into them (count is not one of them).
+# Keys mapped through a SpecialRulesBucketMapper are memoized on the mapper.
+@lru_cache(maxsize=None)
+def _weapon_effective_key(name: str, range_inches: Optional[int], attacks: int,
+                          ap: Optional[int], special: Tuple[str, ...]) -> str:
+    """Effective key for a weapon without rule bucketing."""
+    return _format_weapon_key(name, range_inches, attacks, ap,
+                              tuple(sorted(special, key=str.lower)))
+
+
+@dataclass(slots=True)
 class Weapon:
     """Parsed weapon data."""
     name: str
@@ -278,23 +356,19 @@ class Weapon:
 
         Includes weapon name and exact range - no cross-weapon or range bucketing.
         """
-        # Use exact range, not bucketed
-        if self.range_inches is None or self.range_inches == 0:
-            rng_str = "Melee"
-        else:
-            rng_str = f"{self.range_inches}\""
-
-        ap_str = str(self.ap) if self.ap is not None else "-"
-
-        # Map weapon special rules to buckets if mapper provided
-        if mapper:
-            specials = mapper.normalize_rules_to_buckets(self.special)
-        else:
-            specials = tuple(sorted(self.special, key=str.lower))
-
-        specials_str = ";".join(specials)
-        # Include weapon name to prevent cross-weapon bucketing
-        return f"N={self.name}|R={rng_str}|A={self.attacks}|AP={ap_str}|S={specials_str}"
+        if mapper is None:
+            return _weapon_effective_key(self.name, self.range_inches, self.attacks,
+                                         self.ap, self.special)
+
+        # Map weapon special rules to buckets
+        profile = (self.name, self.range_inches, self.attacks, self.ap, self.special)
+        memo = mapper._weapon_key_memo
+        key = memo.get(profile)
+        if key is None:
+            key = memo[profile] = _format_weapon_key(
+                self.name, self.range_inches, self.attacks, self.ap,
+                mapper.normalize_rules_to_buckets(self.special))
+        return key
 
     def __str__(self) -> str:
         """Format weapon for output in OPR format."""
@@ -315,7 +389,7 @@ class Weapon:
         return weapon_str
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitLoadout:
     """Parsed unit loadout."""
     name: str
@@ -385,7 +459,12 @@ class UnitLoadout:
 
     def bucket_hash(self, mapper: Optional[SpecialRulesBucketMapper] = None) -> str:
         """Short hash for bucket identification."""
-        return hashlib.sha1(self.effective_key(mapper).encode()).hexdigest()[:8].upper()
+        return key_hash(self.effective_key(mapper))
+
+
+def key_hash(key: str) -> str:
+    """Short hash of an effective key, as used for bucket identification."""
+    return hashlib.sha1(key.encode()).hexdigest()[:8].upper()
 
 
 # Regex patterns for parsing
@@ -396,6 +475,9 @@ HEADER_RE = re.compile(
     r"(?P<rules>.*)$"
 )
 
+# Faction ID tag in a unit name
+FID_RE = re.compile(r'\[FID:([0-9A-Fa-f]+)\]')
+
 WEAPON_RE = re.compile(
     r"(?:(?P<count>\d+)x\s+)?"
     r"(?:(?P<range>\d+)\"\s+)?"
@@ -404,36 +486,48 @@ WEAPON_RE = re.compile(
 )
 
 
-def parse_rules(rules_str: str) -> Tuple[str, ...]:
-    """Parse rules string into tuple, handling nested parentheses."""
-    if not rules_str or rules_str.strip() == "-":
-        return ()
+# One comma-separated field: plain characters and parenthesized
+# groups nested up to three deep. Each step consumes one character or one
+# whole group, so a failed match backtracks in linear time.
+_FIELD = r"(?:[^,()]|\((?:[^()]|\((?:[^()]|\([^()]*\))*\))*\))+"
+FIELD_RE = re.compile(_FIELD)
+
+# A whole comma-separated list whose parentheses all balance
+FIELD_LIST_RE = re.compile(rf"(?:{_FIELD})?(?:,(?:{_FIELD})?)*")
 
-    rules = []
-    current = ""
-    depth = 0
 
-    for char in rules_str:
+def split_fields(s: str) -> List[str]:
+    """Split on commas outside parentheses, dropping blank fields."""
+    if FIELD_LIST_RE.fullmatch(s):
+        return [f for f in (m.strip() for m in FIELD_RE.findall(s)) if f]
+
+    # Unbalanced parentheses (seen in some PDF extractions): track depth
+    # by hand so an unclosed "(" keeps the rest of the string together.
+    # Fields are sliced out of s by index rather than built char by char.
+    parts = []
+    start = depth = 0
+    for i, char in enumerate(s):
         if char == "(":
             depth += 1
-            current += char
         elif char == ")":
             depth -= 1
-            current += char
         elif char == "," and depth == 0:
-            rule = current.strip()
-            if rule:
-                rules.append(rule)
-            current = ""
-        else:
-            current += char
+            parts.append(s[start:i])
+            start = i + 1
+    parts.append(s[start:])
+    return [f for f in (p.strip() for p in parts) if f]
+
+
+def parse_rules(rules_str: str) -> Tuple[str, ...]:
+    """Parse rules string into tuple, handling nested parentheses."""
+    if not rules_str or rules_str.strip() == "-":
+        return ()
+
+    return tuple(split_fields(rules_str))
 
-    # Don't forget the last rule
-    rule = current.strip()
-    if rule:
-        rules.append(rule)
 
-    return tuple(rules)
+ATTACKS_RE = re.compile(r"A(\d+)", re.IGNORECASE)
+AP_RE = re.compile(r"AP\((-?\d+)\)", re.IGNORECASE)
 
 
 def parse_weapon_stats(stats_str: str) -> Tuple[int, Optional[int], Tuple[str, ...]]:
@@ -442,38 +536,15 @@ def parse_weapon_stats(stats_str: str) -> Tuple[int, Optional[int], Tuple[str, .
     ap = None
     specials = []
 
-    parts = []
-    current = ""
-    depth = 0
-
-    for char in stats_str:
-        if char == "(":
-            depth += 1
-            current += char
-        elif char == ")":
-            depth -= 1
-            current += char
-        elif char == "," and depth == 0:
-            parts.append(current.strip())
-            current = ""
-        else:
-            current += char
-    if current.strip():
-        parts.append(current.strip())
-
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-
+    for part in split_fields(stats_str):
         # Check for attacks (A#)
-        m = re.match(r"^A(\d+)$", part, re.IGNORECASE)
+        m = ATTACKS_RE.fullmatch(part)
         if m:
             attacks = int(m.group(1))
             continue
 
         # Check for AP
-        m = re.match(r"^AP\((-?\d+)\)$", part, re.IGNORECASE)
+        m = AP_RE.fullmatch(part)
         if m:
             ap = int(m.group(1))
             continue
@@ -492,30 +563,7 @@ def parse_weapons_line(weapons_str: str) -> List[Weapon]:
         return weapons
 
     # Split by comma, but respect parentheses
-    parts = []
-    current = ""
-    depth = 0
-
-    for char in weapons_str:
-        if char == "(":
-            depth += 1
-            current += char
-        elif char == ")":
-            depth -= 1
-            current += char
-        elif char == "," and depth == 0:
-            parts.append(current.strip())
-            current = ""
-        else:
-            current += char
-    if current.strip():
-        parts.append(current.strip())
-
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-
+    for part in split_fields(weapons_str):
         m = WEAPON_RE.match(part)
         if m:
             count = int(m.group("count") or 1)
@@ -538,21 +586,22 @@ def parse_weapons_line(weapons_str: str) -> List[Weapon]:
     return weapons
 
 
-def parse_lines_to_loadouts(lines: List[str]) -> List[UnitLoadout]:
-    """Parse a list of lines into UnitLoadout objects."""
+def parse_lines_to_loadouts(lines: Iterable[str]) -> List[UnitLoadout]:
+    """Parse lines into UnitLoadout objects, consuming them in one pass."""
     loadouts = []
 
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    match_header = HEADER_RE.match
+    it = iter(lines)
+    for line in it:
+        line = line.strip()
 
         # Skip empty lines
         if not line:
-            i += 1
             continue
 
-        # Try to match header
-        m = HEADER_RE.match(line)
+        # Try to match header; a plain substring check rules out most
+        # non-header lines before they reach the regex engine
+        m = match_header(line) if "pts" in line and "|" in line else None
         if m:
             header_line = line
             name = m.group("name").strip()
@@ -564,15 +613,12 @@ def parse_lines_to_loadouts(lines: List[str]) -> List[UnitLoadout]:
 
             # Extract faction ID from name if present
             faction_id = None
-            fid_match = re.search(r'\[FID:([0-9A-Fa-f]+)\]', name)
+            fid_match = FID_RE.search(name)
             if fid_match:
                 faction_id = fid_match.group(1)
 
             # Next line should be weapons
-            i += 1
-            weapons_line = ""
-            if i < len(lines):
-                weapons_line = lines[i].strip()
+            weapons_line = next(it, "").strip()
 
             weapons = parse_weapons_line(weapons_line)
 
@@ -589,8 +635,6 @@ def parse_lines_to_loadouts(lines: List[str]) -> List[UnitLoadout]:
                 faction_id=faction_id,
             ))
 
-        i += 1
-
     return loadouts
 
 
@@ -611,9 +655,12 @@ def parse_loadout_file(filepath: Path) -> List[UnitLoadout]:
             if faction_loadouts:
                 print(f"    {faction_name}: {len(faction_loadouts)} loadouts")
     else:
-        # Parse TXT format
-        lines = filepath.read_text(encoding="utf-8").splitlines()
-        loadouts = parse_lines_to_loadouts(lines)
+        # Parse TXT format, reading it line by line. Each line is split
+        # again so line breaks match str.splitlines() on the whole text.
+        with open(filepath, "r", encoding="utf-8") as f:
+            loadouts = parse_lines_to_loadouts(
+                part for line in f for part in line.splitlines()
+            )
 
     return loadouts
 
@@ -621,11 +668,11 @@ def parse_loadout_file(filepath: Path) -> List[UnitLoadout]:
 def bucket_loadouts(loadouts: List[UnitLoadout],
                     mapper: Optional[SpecialRulesBucketMapper] = None) -> Dict[str, List[UnitLoadout]]:
     """Group loadouts by their effective key."""
-    buckets: Dict[str, List[UnitLoadout]] = defaultdict(list)
+    buckets: Dict[str, List[UnitLoadout]] = {}
+    setdefault = buckets.setdefault
 
     for lo in loadouts:
-        key = lo.effective_key(mapper)
-        buckets[key].append(lo)
+        setdefault(lo.effective_key(mapper), []).append(lo)
 
     return buckets
 
@@ -703,7 +750,8 @@ def reduce_loadouts(input_path: Path, output_path: Path,
     for key in sorted(buckets.keys()):
         bucket = buckets[key]
         rep = select_representative(bucket)
-        bucket_hash = rep.bucket_hash(mapper)
+        # The bucket key is rep's effective key; no need to rebuild it
+        bucket_hash = key_hash(key)
 
         # Track stats
         points_range = (min(lo.points for lo in bucket), max(lo.points for lo in bucket))
@@ -767,7 +815,7 @@ def reduce_loadouts(input_path: Path, output_path: Path,
     print()
     print("Largest buckets (most loadouts grouped together):")
     print("-" * 60)
-    sorted_stats = sorted(bucket_stats, key=lambda x: -x["size"])[:10]
+    sorted_stats = heapq.nlargest(10, bucket_stats, key=itemgetter("size"))
     for stat in sorted_stats:
         pts_min, pts_max = stat["points_range"]
         pts_str = f"{pts_min}pts" if pts_min == pts_max else f"{pts_min}-{pts_max}pts"
@@ -7,6 +7,7 @@ import math
 import os
 import re
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -389,7 +390,7 @@ def normalize_rules_for_signature(rules_in: List[str]) -> Tuple[str, ...]:
                 seen_lower[key] = cleaned
                 out.append(cleaned)
 
-    out = sorted(out, key=lambda x: x.lower())
+    out.sort(key=str.lower)
     return tuple(out)
 
 # =========================================================
@@ -475,7 +476,7 @@ def weapon_key_from_profile(profile: str, weapon_name: str, rng_fallback: Option
             continue
         tags.append(t)
 
-    tags_sorted = tuple(sorted([x for x in tags if x], key=lambda x: x.lower()))
+    tags_sorted = tuple(sorted([x for x in tags if x], key=str.lower))
     # Normalize weapon name for consistent key generation across different sources
     # This ensures "Heavy Sword" and "Heavy sword" generate the same key
     normalized_name = norm_ws(weapon_name).lower()
@@ -486,7 +487,7 @@ def weapon_key_from_profile(profile: str, weapon_name: str, rng_fallback: Option
 
 def build_stage1_signature(points: int, rules: Tuple[str, ...], weapon_multiset: Dict[str, int]) -> str:
     items = [(k, c) for k, c in weapon_multiset.items() if c > 0]
-    items.sort(key=lambda kv: kv[0])
+    items.sort(key=itemgetter(0))
     weapons_key = "|".join([f"{k}*{c}" for k, c in items])
 
     parts: List[str] = []
@@ -596,7 +597,7 @@ def _compute_option_weapon_key(opt: Dict[str, Any]) -> Tuple[str, int, int, List
             special_rules = weapon_data.get("special_rules", [])
             wkey = f"N={normalized_name}|R={'' if rng is None else rng}|A={attacks}|AP={'' if ap is None else ap}"
             if special_rules:
-                tags_sorted = tuple(sorted([x for x in special_rules if x], key=lambda x: x.lower()))
+                tags_sorted = tuple(sorted([x for x in special_rules if x], key=str.lower))
                 wkey += "|T=" + ";".join(tags_sorted)
             weapon_keys.append(wkey)
         # Sort weapon keys for consistent ordering
@@ -649,7 +650,7 @@ def build_base_weapon_multiset(unit: Dict[str, Any]) -> Tuple[Dict[str, int], Di
                 rng = int(m.group("r"))
         attacks = int(w.get("attacks", 0) or 0)
         ap = w.get("ap", None)
-        tags = tuple(sorted([str(s).strip() for s in (w.get("special") or []) if str(s).strip() and str(s).strip() != "-"], key=lambda x: x.lower()))
+        tags = tuple(sorted([str(s).strip() for s in (w.get("special") or []) if str(s).strip() and str(s).strip() != "-"], key=str.lower))
 
         # Normalize weapon name for consistent key generation (same as weapon_key_from_profile)
         normalized_name = norm_ws(name).lower()
@@ -677,7 +678,7 @@ def group_variants(unit: Dict[str, Any], group: Dict[str, Any], name_to_key: Dic
 
     def make(pts: int, add_rules: List[str], weapon_delta: Dict[str, int]) -> Variant:
         # compress
-        wd = tuple(sorted([(k, v) for k, v in weapon_delta.items() if v != 0], key=lambda kv: kv[0]))
+        wd = tuple(sorted([(k, v) for k, v in weapon_delta.items() if v != 0], key=itemgetter(0)))
         ar = tuple([r for r in (x.strip() for x in add_rules) if r])
         return Variant(pts_delta=pts, add_rules=ar, weapon_delta=wd)
 
@@ -809,7 +810,7 @@ def group_variants(unit: Dict[str, Any], group: Dict[str, Any], name_to_key: Dic
                         special_rules = weapon_data.get("special_rules", [])
                         wkey = f"N={normalized_name}|R={'' if rng is None else rng}|A={attacks}|AP={'' if ap is None else ap}"
                         if special_rules:
-                            tags_sorted = tuple(sorted([x for x in special_rules if x], key=lambda x: x.lower()))
+                            tags_sorted = tuple(sorted([x for x in special_rules if x], key=str.lower))
                             wkey += "|T=" + ";".join(tags_sorted)
                         add_keys.append(wkey)
                 elif inside and looks_like_weapon_profile(inside):
@@ -885,7 +886,7 @@ def group_variants(unit: Dict[str, Any], group: Dict[str, Any], name_to_key: Dic
                             special_rules = weapon_data.get("special_rules", [])
                             wkey = f"N={normalized_name}|R={'' if rng is None else rng}|A={attacks}|AP={'' if ap is None else ap}"
                             if special_rules:
-                                tags_sorted = tuple(sorted([x for x in special_rules if x], key=lambda x: x.lower()))
+                                tags_sorted = tuple(sorted([x for x in special_rules if x], key=str.lower))
                                 wkey += "|T=" + ";".join(tags_sorted)
                             add_keys.append(wkey)
                     elif inside and looks_like_weapon_profile(inside):
@@ -1096,7 +1097,7 @@ def parse_stage1_W_items(w_value: str) -> List[Tuple[str, Optional[int], Optiona
                 ap = None
 
         t_raw = d.get("T", "")
-        tags: Tuple[str, ...] = tuple(sorted([t for t in (t_raw.split(";") if t_raw else []) if t], key=lambda x: x.lower()))
+        tags: Tuple[str, ...] = tuple(sorted([t for t in (t_raw.split(";") if t_raw else []) if t], key=str.lower))
         out.append((name, rng, ap, tags, attacks, count))
 
     for t in tokens:
@@ -1115,7 +1116,7 @@ def parse_stage1_W_items(w_value: str) -> List[Tuple[str, Optional[int], Optiona
 # =========================================================
 # Weapon Grouping System - Groups by matching rules (range, AP, tags)
 # =========================================================
-@dataclass
+@dataclass(slots=True)
 class WeaponGroup:
     """Represents a group of weapons with identical rules but potentially different attacks."""
     group_id: str
@@ -1463,7 +1464,7 @@ def stage2_reduce(stage1_groups: List[Dict[str, Any]],
 # =========================================================
 # Raw Loadout Mode: No grouping, each combo gets a UID
 # =========================================================
-@dataclass
+@dataclass(slots=True)
 class RawLoadout:
     """Represents a single unit loadout with UID."""
     uid: str
@@ -1648,7 +1649,7 @@ def generate_raw_loadouts_parallel(unit: Dict[str, Any],
                 all_loadouts.extend(fut.result())
 
     # Sort by combo_index for deterministic output
-    all_loadouts.sort(key=lambda x: x["combo_index"])
+    all_loadouts.sort(key=itemgetter("combo_index"))
 
     # Build RawLoadout objects and output
     unit_name = str(unit.get("name", "")).strip()
@@ -1770,9 +1771,11 @@ def stage1_reduce_inline_parallel(unit: Dict[str, Any],
 
     # Build stage-1 groups list
     out_groups: List[Dict[str, Any]] = []
-    for sig in sorted(merged.keys(), key=lambda s: sha1(s)):
+    # Decorate each signature with its digest once; it is both the sort
+    # key and the source of the group ID
+    for digest, sig in sorted((sha1(s), s) for s in merged):
         info = merged[sig]
-        group_id = sha1(sig)[:10]
+        group_id = digest[:10]
         rep_idx = int(info["rep_idx"])
         rep = {
             "combo_index_0based": rep_idx,
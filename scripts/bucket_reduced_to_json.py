@@ -222,8 +222,11 @@ def convert_to_json(input_path: Path, output_path: Path) -> None:
         "total_units": len(units),
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # json.dump with indent writes one small chunk at a time; encoding the
+    # whole document once and writing the bytes avoids the text-layer calls
+    output_path.write_bytes(
+        json.dumps(output_data, indent=2, ensure_ascii=False).encode("utf-8")
+    )
 
     print(f"Wrote JSON to: {output_path}")
 
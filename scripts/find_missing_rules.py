@@ -26,6 +26,25 @@ UNUSED_OUTPUT_FILE = '/home/user/Science-Battle-Simulator/docs/unused_rules_repo
 SCRIPT_VERSION = "1.7"
 
 
+RULE_BASE_NAME_RE = re.compile(r'^([A-Za-z][A-Za-z\s\-\'!]+?)(?:\s*\([\d\+]+\))?$')
+
+# Single-pass character substitutions for normalize_rule_name
+RULE_NAME_TRANSLATION = str.maketrans({
+    ' ': '_',
+    '-': '_',
+    "'": '_',
+    '&': '_AND_',
+    '!': None,
+})
+
+UNDERSCORE_RUN_RE = re.compile(r'__+')
+
+# Unit-line detection and unit-name extraction for find_missing_rules
+UNIT_LINE_RE = re.compile(r'Q\d+\+.*D\d+\+')
+UNIT_COST_LINE_RE = re.compile(r'\[\d+\].*\|.*pts')
+UNIT_NAME_RE = re.compile(r'^([^\[]+)')
+
+
 def normalize_rule_name(rule: str) -> str:
     """
     Normalize a rule name for comparison.
@@ -37,7 +56,7 @@ def normalize_rule_name(rule: str) -> str:
     """
     rule = rule.strip()
     # Extract base rule name (without parameter)
-    match = re.match(r'^([A-Za-z][A-Za-z\s\-\'!]+?)(?:\s*\([\d\+]+\))?$', rule)
+    match = RULE_BASE_NAME_RE.match(rule)
     if match:
         base_name = match.group(1).strip()
     else:
@@ -45,10 +64,9 @@ def normalize_rule_name(rule: str) -> str:
 
     # Normalize: uppercase, replace spaces/hyphens/ampersands with underscores
     # Also strip ! from rule names (e.g., "Boom!" -> "BOOM")
-    normalized = base_name.upper().replace(' ', '_').replace('-', '_').replace("'", '_').replace('&', '_AND_').replace('!', '')
+    normalized = base_name.upper().translate(RULE_NAME_TRANSLATION)
     # Clean up any double underscores from "& " or " &" patterns
-    while '__' in normalized:
-        normalized = normalized.replace('__', '_')
+    normalized = UNDERSCORE_RUN_RE.sub('_', normalized)
     # Strip leading/trailing underscores
     normalized = normalized.strip('_')
     return normalized
@@ -264,31 +282,26 @@ def find_missing_rules(units_file: str, matrix_file: str) -> dict:
             continue
 
         # Check if this is a unit line (contains Q#+ D#+)
-        if re.search(r'Q\d+\+.*D\d+\+', line) or re.search(r'\[\d+\].*\|.*pts', line):
+        if UNIT_LINE_RE.search(line) or UNIT_COST_LINE_RE.search(line):
             # Extract unit name
-            unit_match = re.match(r'^([^\[]+)', line)
+            unit_match = UNIT_NAME_RE.match(line)
             if unit_match:
                 current_unit = unit_match.group(1).strip()
 
             # Extract rules from unit line
             rules = extract_rules_from_unit_line(line)
-            for rule in rules:
-                all_rules_found.add(rule)
-                rule_occurrences[rule].append({
-                    'line': line_num,
-                    'unit': current_unit,
-                    'context': 'unit_stat'
-                })
+            context = 'unit_stat'
         else:
             # This is likely a weapon line
             rules = extract_rules_from_weapon_line(line)
-            for rule in rules:
-                all_rules_found.add(rule)
-                rule_occurrences[rule].append({
-                    'line': line_num,
-                    'unit': current_unit,
-                    'context': 'weapon'
-                })
+            context = 'weapon'
+        for rule in rules:
+            all_rules_found.add(rule)
+            rule_occurrences[rule].append({
+                'line': line_num,
+                'unit': current_unit,
+                'context': context
+            })
 
     # Find missing rules
     missing_rules = set()
@@ -428,7 +441,7 @@ def main():
             print(f"{rule:<40} {count:<15} {sample_unit}")
 
         # Also write to a file
-        with open(output_file, 'w') as f:
+        with open(output_file, 'w', buffering=1 << 20) as f:
             f.write("MISSING RULES REPORT\n")
             f.write("="*80 + "\n\n")
             f.write(f"Total unique rules in units file: {results['total_rules_found']}\n")
@@ -437,12 +450,16 @@ def main():
 
             f.write("MISSING RULES:\n")
             f.write("-"*80 + "\n")
+            lines = []
             for rule, count in missing_with_counts:
-                f.write(f"{rule:<40} (found {count} times)\n")
+                lines.append(f"{rule:<40} (found {count} times)\n")
                 # Show first 3 example occurrences
                 occurrences = results['rule_occurrences'].get(rule, [])[:3]
-                for occ in occurrences:
-                    f.write(f"    - Line {occ['line']}: {occ['unit']} ({occ['context']})\n")
+                lines.extend(
+                    f"    - Line {occ['line']}: {occ['unit']} ({occ['context']})\n"
+                    for occ in occurrences
+                )
+            f.writelines(lines)
 
         print(f"\n\nDetailed report written to: {output_file}")
     else:
@@ -471,7 +488,7 @@ def main():
         # Load matrix for additional info
         matrix_df = pd.read_excel(matrix_file)
 
-        with open(unused_output_file, 'w') as f:
+        with open(unused_output_file, 'w', buffering=1 << 20) as f:
             f.write("UNUSED MATRIX RULES REPORT\n")
             f.write("="*80 + "\n\n")
             f.write(f"Total rules in matrix: {len(results['all_matrix_rules'])}\n")
@@ -482,23 +499,34 @@ def main():
             f.write("UNUSED RULES LIST\n")
             f.write("="*80 + "\n\n")
 
+            # Index the matrix once (first row per Rule ID) instead of
+            # filtering the whole DataFrame for every unused rule
+            matrix_rows = {
+                rid: (name, cat, notes)
+                for rid, name, cat, notes in matrix_df[
+                    ['Rule ID', 'Rule Name', 'Grant Category', 'Notes']
+                ].drop_duplicates('Rule ID').itertuples(index=False, name=None)
+            }
+
+            lines = []
             for rule_id in unused_sorted:
                 # Try to get additional info from matrix
-                row = matrix_df[matrix_df['Rule ID'] == rule_id]
-                if not row.empty:
-                    rule_name = row['Rule Name'].values[0] if pd.notna(row['Rule Name'].values[0]) else rule_id
-                    grant_cat = row['Grant Category'].values[0] if pd.notna(row['Grant Category'].values[0]) else ''
-                    notes = row['Notes'].values[0] if pd.notna(row['Notes'].values[0]) else ''
-
-                    f.write(f"{rule_id}\n")
-                    f.write(f"    Name: {rule_name}\n")
+                row = matrix_rows.get(rule_id)
+                if row is not None:
+                    rule_name = row[0] if pd.notna(row[0]) else rule_id
+                    grant_cat = row[1] if pd.notna(row[1]) else ''
+                    notes = row[2] if pd.notna(row[2]) else ''
+
+                    lines.append(f"{rule_id}\n")
+                    lines.append(f"    Name: {rule_name}\n")
                     if grant_cat:
-                        f.write(f"    Grant Category: {grant_cat}\n")
+                        lines.append(f"    Grant Category: {grant_cat}\n")
                     if notes:
-                        f.write(f"    Notes: {notes[:80]}{'...' if len(str(notes)) > 80 else ''}\n")
-                    f.write("\n")
+                        lines.append(f"    Notes: {notes[:80]}{'...' if len(str(notes)) > 80 else ''}\n")
+                    lines.append("\n")
                 else:
-                    f.write(f"{rule_id}\n\n")
+                    lines.append(f"{rule_id}\n\n")
+            f.writelines(lines)
 
         print(f"\nUnused rules report written to: {unused_output_file}")
     else:
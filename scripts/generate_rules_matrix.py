@@ -10,8 +10,24 @@ from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.worksheet.datavalidation import DataValidation
 import openpyxl
 from collections import defaultdict
+from functools import lru_cache
 import re
 
+# Patterns used by parse_rule_for_engine on lowercased rule text
+AP_BONUS_RE = re.compile(r'ap\s*\(\+?(\d+)\)')
+AP_VALUE_RE = re.compile(r'ap\s*\((\d+)\)')
+MOVE_BONUS_RE = re.compile(r'\+(\d+)"')
+BLAST_RE = re.compile(r'blast\s*\((\d+)\)')
+DEADLY_RE = re.compile(r'deadly\s*\((\d+)\)')
+ROLL_TARGET_RE = re.compile(r'(\d)\+')
+TAKES_HITS_RE = re.compile(r'takes?\s+(\d+)\s+hits?')
+TOUGH_RE = re.compile(r'tough\s*\((\d+)\)')
+
+# Patterns used by create_rule_id
+PARENTHESIZED_RE = re.compile(r'\s*\([^)]*\)')
+NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+UNDERSCORE_RUN_RE = re.compile(r'_+')
+
 def extract_rules_from_faction_file():
     """Extract all unique rules from the faction rules Excel file."""
     wb = openpyxl.load_workbook('/home/user/Science-Battle-Simulator/Faction Specific Army Rules.xlsx')
@@ -36,8 +52,23 @@ def extract_rules_from_faction_file():
 
 def parse_rule_for_engine(name, info):
     """Parse a rule's text to determine engine configuration."""
-    text = info['text'].lower()
-    rule_type = (info['type'] or '').lower()
+    parsed = _parse_rule_text(
+        info['text'].lower(),
+        (info['type'] or '').lower(),
+        info['once_per_game'],
+        info['once_per_activation'],
+    )
+    # Copy the cached dict, phases included, so callers may mutate it
+    return {**parsed, 'phases': dict(parsed['phases'])}
+
+@lru_cache(maxsize=None)
+def _parse_rule_text(text, rule_type, once_per_game, once_per_activation):
+    """Engine configuration for lowercased rule text.
+
+    Cached because many factions reprint the same rule text under
+    different names; the returned dict is shared, so parse_rule_for_engine
+    hands out copies of it.
+    """
 
     # Default values
     phases = {'DEP': '', 'MOV': '', 'CHG': '', 'SHT': '', 'MEL': '', 'MOR': '', 'RND': ''}
@@ -98,7 +129,7 @@ def parse_rule_for_engine(name, info):
             effect_target = 'hits'
             effect_value = 'sixes_rolled'
         elif 'ap (+' in text or 'ap(+' in text:
-            match = re.search(r'ap\s*\(\+?(\d+)\)', text)
+            match = AP_BONUS_RE.search(text)
             if match:
                 effect_type = 'ADD'
                 effect_target = 'ap'
@@ -138,7 +169,7 @@ def parse_rule_for_engine(name, info):
         trigger_step = 'MOVEMENT'
         effect_type = 'ADD'
         effect_target = 'move_distance'
-        match = re.search(r'\+(\d+)"', text)
+        match = MOVE_BONUS_RE.search(text)
         if match:
             effect_value = match.group(1)
 
@@ -147,14 +178,14 @@ def parse_rule_for_engine(name, info):
         trigger_step = 'CALC_AP'
         effect_type = 'ADD'
         effect_target = 'ap'
-        match = re.search(r'ap\s*\(\+?(\d+)\)', text)
+        match = AP_BONUS_RE.search(text)
         if match:
             effect_value = match.group(1)
     elif 'ap (' in text or 'ap(' in text:
         trigger_step = 'CALC_AP'
         effect_type = 'SET'
         effect_target = 'ap'
-        match = re.search(r'ap\s*\((\d+)\)', text)
+        match = AP_VALUE_RE.search(text)
         if match:
             effect_value = match.group(1)
 
@@ -163,7 +194,7 @@ def parse_rule_for_engine(name, info):
         trigger_step = 'AFTER_HIT'
         effect_type = 'MULTIPLY'
         effect_target = 'hits'
-        match = re.search(r'blast\s*\((\d+)\)', text)
+        match = BLAST_RE.search(text)
         if match:
             effect_value = f"min({match.group(1)}, enemy_models)"
 
@@ -172,7 +203,7 @@ def parse_rule_for_engine(name, info):
         trigger_step = 'AFTER_WOUND'
         effect_type = 'MULTIPLY'
         effect_target = 'wounds'
-        match = re.search(r'deadly\s*\((\d+)\)', text)
+        match = DEADLY_RE.search(text)
         if match:
             effect_value = match.group(1)
 
@@ -187,7 +218,7 @@ def parse_rule_for_engine(name, info):
         else:
             trigger_step = 'REGEN'
             effect_type = 'ROLL'
-            match = re.search(r'(\d)\+', text)
+            match = ROLL_TARGET_RE.search(text)
             if match:
                 effect_target = 'ignore_wound'
                 effect_value = f"{match.group(1)}+"
@@ -203,7 +234,7 @@ def parse_rule_for_engine(name, info):
         # Try to find what is granted
         if 'takes' in text and 'hit' in text:
             effect_type = 'DAMAGE'
-            match = re.search(r'takes?\s+(\d+)\s+hits?', text)
+            match = TAKES_HITS_RE.search(text)
             if match:
                 effect_value = match.group(1)
                 effect_target = 'direct_hits'
@@ -213,7 +244,7 @@ def parse_rule_for_engine(name, info):
         trigger_step = 'DIRECT_DAMAGE'
         effect_type = 'DAMAGE'
         target_unit = 'ENEMY'
-        match = re.search(r'takes?\s+(\d+)\s+hits?', text)
+        match = TAKES_HITS_RE.search(text)
         if match:
             effect_target = 'direct_hits'
             effect_value = match.group(1)
@@ -279,7 +310,7 @@ def parse_rule_for_engine(name, info):
         trigger_step = 'ALLOCATE'
         effect_type = 'SET'
         effect_target = 'wounds_to_kill'
-        match = re.search(r'tough\s*\((\d+)\)', text)
+        match = TOUGH_RE.search(text)
         if match:
             effect_value = match.group(1)
 
@@ -300,9 +331,9 @@ def parse_rule_for_engine(name, info):
         effect_value = 'sixes_rolled'
 
     # Handle once per game/activation
-    if info['once_per_game']:
+    if once_per_game:
         trigger_condition = f"once_per_game AND {trigger_condition}" if trigger_condition != 'always' else 'once_per_game'
-    if info['once_per_activation']:
+    if once_per_activation:
         trigger_condition = f"once_per_activation AND {trigger_condition}" if trigger_condition != 'always' else 'once_per_activation'
 
     # If we still don't have phases, default to combat
@@ -324,11 +355,11 @@ def parse_rule_for_engine(name, info):
 def create_rule_id(name):
     """Create a code-friendly rule ID from the rule name."""
     # Remove parentheses content
-    clean = re.sub(r'\s*\([^)]*\)', '', name)
+    clean = PARENTHESIZED_RE.sub('', name)
     # Replace spaces and special chars with underscores
-    clean = re.sub(r'[^a-zA-Z0-9]', '_', clean)
+    clean = NON_ALNUM_RE.sub('_', clean)
     # Remove consecutive underscores
-    clean = re.sub(r'_+', '_', clean)
+    clean = UNDERSCORE_RUN_RE.sub('_', clean)
     # Remove leading/trailing underscores
     clean = clean.strip('_')
     return clean.upper()
@@ -12,9 +12,12 @@ with the same name from being incorrectly grouped together.
 
 import hashlib
 import json
+import os
 import re
+import textwrap
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List
 
 
 def generate_faction_id(faction_name: str) -> str:
@@ -31,14 +34,29 @@ OUTPUT_DIR = r"C:\Users\David\Documents\Army Factions\pipeline_output4"
 # Output: The merged file will be created in the output directory
 MERGED_FILENAME = "all_factions_merged.json"
 
+# Unit headers: "Unit Name [count] Q#+ D#+ | ###pts | rules"
+UNIT_HEADER_PATTERN = re.compile(r'^(.+?)(\s*\[\d+\]\s+Q\d+\+\s+D\d+\+\s*\|.+)$')
+
 
 def find_merged_files(output_dir: Path) -> List[Path]:
     """Find all *.final.merged.txt files in the output directory."""
-    merged_files = sorted(
-        output_dir.glob("*/*.final.merged.txt"),
-        key=lambda p: p.stem.lower()
-    )
-    return merged_files
+    # os.scandir reuses the directory listing's type info instead of
+    # building and stat-ing a Path for every entry like Path.glob
+    suffix = ".final.merged.txt"
+    keyed = []
+    with os.scandir(output_dir) as faction_dirs:
+        for faction_dir in faction_dirs:
+            if not faction_dir.is_dir():
+                continue
+            with os.scandir(faction_dir.path) as entries:
+                for entry in entries:
+                    # Case-insensitive, as Path.glob is on Windows
+                    name = entry.name.lower()
+                    if name.endswith(suffix):
+                        # Sort on the lowercased stem (name without ".txt")
+                        keyed.append((name[:-4], entry.path))
+    keyed.sort(key=itemgetter(0))
+    return [Path(path) for _, path in keyed]
 
 
 def extract_faction_name(file_path: Path) -> str:
@@ -65,78 +83,79 @@ def merge_all_factions(output_dir: Path) -> Path:
     for f in merged_files:
         print(f"  - {f.name}")
 
-    factions_data: List[Dict[str, Any]] = []
-    total_unit_count = 0
-
-    for file_path in merged_files:
-        faction_name = extract_faction_name(file_path)
-
-        # Read file content
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-        except Exception as e:
-            print(f"[ERROR] Failed to read {file_path}: {e}")
-            continue
-
-        lines = content.splitlines()
-
-        # Strip BOM if present
-        if lines and lines[0].startswith("\ufeff"):
-            lines[0] = lines[0].lstrip("\ufeff")
-
-        # Skip empty files
-        if not any(line.strip() for line in lines):
-            print(f"[WARN] Skipping empty file: {file_path.name}")
-            continue
-
-        # Strip leading/trailing blank lines
-        while lines and not lines[0].strip():
-            lines.pop(0)
-        while lines and not lines[-1].strip():
-            lines.pop()
-
-        # Generate faction ID for this faction
-        faction_id = generate_faction_id(faction_name)
-
-        # Inject [FID:XXXXXXXX] into each unit header line
-        # Unit headers match pattern: "Unit Name [count] Q#+ D#+ | ###pts | rules"
-        tagged_lines = []
-        unit_header_pattern = re.compile(r'^(.+?)(\s*\[\d+\]\s+Q\d+\+\s+D\d+\+\s*\|.+)$')
-        for line in lines:
-            match = unit_header_pattern.match(line)
-            if match:
-                # Inject FID between unit name and the rest of the header
-                unit_name = match.group(1).rstrip()
-                rest_of_line = match.group(2)
-                tagged_line = f"{unit_name} [FID:{faction_id}]{rest_of_line}"
-                tagged_lines.append(tagged_line)
-            else:
-                tagged_lines.append(line)
-
-        # Count units for this faction
-        unit_count = sum(1 for line in tagged_lines if " Q" in line and " D" in line and "pts |" in line)
-        total_unit_count += unit_count
-
-        factions_data.append({
-            "name": faction_name,
-            "faction_id": faction_id,
-            "units": tagged_lines,
-            "unit_count": unit_count
-        })
-
-    # Build output structure
-    output_data = {
-        "factions": factions_data,
-        "total_factions": len(factions_data),
-        "total_unit_loadouts": total_unit_count
-    }
-
-    # Write output file
+    # Factions are written to the output as they are read, so only one
+    # faction's lines are held in memory. The layout matches
+    # json.dump(output_data, f, indent=2).
     out_file = output_dir / MERGED_FILENAME
-    with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    faction_count = 0
+    total_unit_count = 0
 
-    print(f"\n[OK] Merged {len(factions_data)} factions -> {out_file}")
+    with open(out_file, "wb", buffering=1 << 20) as f:
+        f.write(b'{\n  "factions": [')
+
+        for file_path in merged_files:
+            faction_name = extract_faction_name(file_path)
+
+            # Read file content
+            try:
+                content = file_path.read_text(encoding="utf-8", errors="replace")
+            except Exception as e:
+                print(f"[ERROR] Failed to read {file_path}: {e}")
+                continue
+
+            lines = content.splitlines()
+
+            # Strip BOM if present
+            if lines and lines[0].startswith("\ufeff"):
+                lines[0] = lines[0].lstrip("\ufeff")
+
+            # Skip empty files
+            if not any(line.strip() for line in lines):
+                print(f"[WARN] Skipping empty file: {file_path.name}")
+                continue
+
+            # Strip leading/trailing blank lines
+            while lines and not lines[0].strip():
+                lines.pop(0)
+            while lines and not lines[-1].strip():
+                lines.pop()
+
+            # Generate faction ID for this faction
+            faction_id = generate_faction_id(faction_name)
+
+            # Inject [FID:XXXXXXXX] into each unit header line
+            tagged_lines = []
+            for line in lines:
+                match = UNIT_HEADER_PATTERN.match(line)
+                if match:
+                    # Inject FID between unit name and the rest of the header
+                    unit_name = match.group(1).rstrip()
+                    rest_of_line = match.group(2)
+                    tagged_line = f"{unit_name} [FID:{faction_id}]{rest_of_line}"
+                    tagged_lines.append(tagged_line)
+                else:
+                    tagged_lines.append(line)
+
+            # Count units for this faction
+            unit_count = sum(1 for line in tagged_lines if " Q" in line and " D" in line and "pts |" in line)
+            total_unit_count += unit_count
+
+            faction_json = json.dumps({
+                "name": faction_name,
+                "faction_id": faction_id,
+                "units": tagged_lines,
+                "unit_count": unit_count
+            }, indent=2, ensure_ascii=False)
+
+            f.write(b",\n" if faction_count else b"\n")
+            f.write(textwrap.indent(faction_json, "    ").encode("utf-8"))
+            faction_count += 1
+
+        f.write(b"\n  ]" if faction_count else b"]")
+        f.write(f',\n  "total_factions": {faction_count},'.encode("utf-8"))
+        f.write(f'\n  "total_unit_loadouts": {total_unit_count}\n}}'.encode("utf-8"))
+
+    print(f"\n[OK] Merged {faction_count} factions -> {out_file}")
     print(f"[OK] Total unit loadouts: ~{total_unit_count:,}")
 
     return out_file
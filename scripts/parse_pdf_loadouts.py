@@ -36,7 +36,7 @@ from typing import List, Optional, Dict, Any, Tuple
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Weapon:
     """Represents a weapon profile."""
     name: str
@@ -70,7 +70,7 @@ class Weapon:
         return " ".join(parts) + " (" + ", ".join(profile_parts) + ")"
 
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeOption:
     """Represents a single upgrade option."""
     text: str
@@ -79,14 +79,14 @@ class UpgradeOption:
     weapons: List[Weapon] = field(default_factory=list)  # Supports multiple weapons (e.g., dual-weapon upgrades)
 
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeGroup:
     """Represents a group of upgrade options (e.g., 'Replace any Heavy Razor Claw')."""
     header: str
     options: List[UpgradeOption] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
     """Represents a complete unit entry from the PDF."""
     name: str
@@ -1237,24 +1237,27 @@ def write_txt_output(units: List[Unit], output_path: Path) -> None:
 def write_base_units_csv(units: List[Unit], output_path: Path) -> None:
     """Write units to CSV for easy spreadsheet viewing."""
     import csv
-
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "Name", "Size", "Quality", "Defense", "Tough", "Points",
-            "Special Rules", "Weapons", "Upgrade Groups"
-        ])
-
-        for unit in units:
-            weapons_str = "; ".join(w.to_string() for w in unit.weapons)
-            rules_str = ", ".join(unit.special_rules)
-            upgrades_str = "; ".join(g.header for g in unit.upgrade_groups)
-
-            writer.writerow([
-                unit.name, unit.size, f"{unit.quality}+", f"{unit.defense}+",
-                unit.tough or "-", unit.base_points,
-                rules_str, weapons_str, upgrades_str
-            ])
+    import io
+
+    # Format the whole CSV in memory and write it with a single call
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow([
+        "Name", "Size", "Quality", "Defense", "Tough", "Points",
+        "Special Rules", "Weapons", "Upgrade Groups"
+    ])
+
+    writer.writerows(
+        (
+            unit.name, unit.size, f"{unit.quality}+", f"{unit.defense}+",
+            unit.tough or "-", unit.base_points,
+            ", ".join(unit.special_rules),
+            "; ".join(w.to_string() for w in unit.weapons),
+            "; ".join(g.header for g in unit.upgrade_groups),
+        )
+        for unit in units
+    )
+    output_path.write_text(buffer.getvalue(), encoding="utf-8", newline="")
 
     print(f"Wrote {len(units)} units to {output_path}")
 
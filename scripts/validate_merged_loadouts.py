@@ -9,11 +9,12 @@ When reading JSON, properly extracts unit lines from the factions structure.
 
 import json
 import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 try:
     from openpyxl import Workbook
@@ -35,7 +36,7 @@ OUTPUT_WORKBOOK = r"C:\Users\David\Documents\Army Factions\pipeline_output\valid
 # Data Structures
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UnitEntry:
     """Represents a single unit loadout entry from the merged file."""
     raw_header: str
@@ -77,6 +78,9 @@ HEADER_PATTERN = re.compile(
     r'\s*(.*)$'                             # Rules (rest of line)
 )
 
+# Quick check for header lines: Q#+ D#+ stats
+STATS_PATTERN = re.compile(r'Q\d\+\s+D\d\+')
+
 # Pattern to extract UID, BKT, or FID from unit name
 IDENTIFIER_PATTERN = re.compile(r'\[(UID|BKT|FID):([A-F0-9]+)\]', re.IGNORECASE)
 
@@ -108,9 +112,10 @@ def extract_identifier(name: str) -> Tuple[str, str, str, str]:
             identifier = id_value
             identifier_type = id_type
 
-    # Remove all identifier tags from name
-    base_name = IDENTIFIER_PATTERN.sub('', name).strip()
-    return base_name, identifier, identifier_type, faction_id
+    # Remove all identifier tags from name. Names and faction IDs repeat
+    # across many entries and are used as dict keys, so intern them.
+    base_name = sys.intern(IDENTIFIER_PATTERN.sub('', name).strip())
+    return base_name, identifier, identifier_type, sys.intern(faction_id)
 
 
 def parse_header(header: str, line_number: int) -> Optional[UnitEntry]:
@@ -165,7 +170,7 @@ def parse_header(header: str, line_number: int) -> Optional[UnitEntry]:
         errors.append(f"Invalid points: {match.group(5)}")
 
     rules_str = match.group(6).strip()
-    rules = [r.strip() for r in rules_str.split(',') if r.strip()] if rules_str else []
+    rules = [sys.intern(r.strip()) for r in rules_str.split(',') if r.strip()] if rules_str else []
 
     return UnitEntry(
         raw_header=header,
@@ -191,24 +196,24 @@ def parse_lines_to_entries(lines: List[str], start_line: int = 1) -> List[UnitEn
     line_number = start_line
 
     for line in lines:
-        stripped = line.strip()
-
-        # Skip empty lines - they separate entries
-        if not stripped:
+        # Skip empty lines - they separate entries. Lines are only stripped
+        # once we know they are kept, so blank and ignored lines cost no copy.
+        if not line or line.isspace():
             if current_entry:
                 entries.append(current_entry)
                 current_entry = None
             line_number += 1
             continue
 
-        # Check if this looks like a header line (has Q#+ D#+ pattern)
-        if re.search(r'Q\d\+\s+D\d\+', stripped):
+        # Check if this looks like a header line (has Q#+ D#+ pattern);
+        # lines without a '+' can't match, so skip the regex for them
+        if '+' in line and STATS_PATTERN.search(line):
             if current_entry:
                 entries.append(current_entry)
-            current_entry = parse_header(stripped, line_number)
+            current_entry = parse_header(line.strip(), line_number)
         elif current_entry:
             # This is a weapon line
-            current_entry.weapon_lines.append(stripped)
+            current_entry.weapon_lines.append(line.strip())
 
         line_number += 1
 
@@ -272,8 +277,7 @@ def _legacy_parse_merged_file(filepath: str) -> List[UnitEntry]:
         print(f"ERROR: File not found: {filepath}")
         return entries
 
-    with open(path, 'r', encoding='utf-8-sig') as f:
-        lines = f.readlines()
+    lines = path.read_text(encoding='utf-8-sig').splitlines()
 
     current_entry = None
     line_number = 0
@@ -289,8 +293,9 @@ def _legacy_parse_merged_file(filepath: str) -> List[UnitEntry]:
                 current_entry = None
             continue
 
-        # Check if this looks like a header line (has Q#+ D#+ pattern)
-        if re.search(r'Q\d\+\s+D\d\+', stripped):
+        # Check if this looks like a header line (has Q#+ D#+ pattern);
+        # lines without a '+' can't match, so skip the regex for them
+        if '+' in stripped and STATS_PATTERN.search(stripped):
             if current_entry:
                 entries.append(current_entry)
             current_entry = parse_header(stripped, line_number)
@@ -311,13 +316,8 @@ def _legacy_parse_merged_file(filepath: str) -> List[UnitEntry]:
 
 def validate_completeness(source: List[UnitEntry], reduced: List[UnitEntry]) -> ValidationResult:
     """Check that all units in source appear in reduced."""
-    source_names = defaultdict(int)
-    for entry in source:
-        source_names[entry.base_name] += 1
-
-    reduced_names = defaultdict(int)
-    for entry in reduced:
-        reduced_names[entry.base_name] += 1
+    source_names = Counter(entry.base_name for entry in source)
+    reduced_names = Counter(entry.base_name for entry in reduced)
 
     missing = []
     for name, count in source_names.items():
@@ -343,9 +343,7 @@ def validate_orphans(source: List[UnitEntry], reduced: List[UnitEntry]) -> Valid
     """Check for units in reduced that don't exist in source."""
     source_names = set(entry.base_name for entry in source)
 
-    reduced_counts = defaultdict(int)
-    for entry in reduced:
-        reduced_counts[entry.base_name] += 1
+    reduced_counts = Counter(entry.base_name for entry in reduced)
 
     orphans = []
     for name, count in reduced_counts.items():